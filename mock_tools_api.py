@@ -1,6 +1,9 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from typing import Any, Dict, List
 from pydantic import BaseModel
+import hashlib
 import uvicorn
+import json
 
 app = FastAPI(
     title="Cognition Core API",
@@ -15,6 +18,15 @@ class CalculatorRequest(BaseModel):
     operation: str
 
 
+class BatchCall(BaseModel):
+    tool: str
+    arguments: Dict[str, Any]
+
+
+class BatchRequest(BaseModel):
+    calls: List[BatchCall]
+
+
 # Tool definitions that match our ToolDefinition schema
 AVAILABLE_TOOLS = {
     "tools": [
@@ -42,9 +54,17 @@ AVAILABLE_TOOLS = {
 }
 
 
+TOOLS_DIGEST = hashlib.sha256(json.dumps(AVAILABLE_TOOLS, sort_keys=True).encode())
+TOOLS_ETAG = f'"{TOOLS_DIGEST.hexdigest()}"'
+
+
 @app.get("/tools")
-async def list_tools():
-    """Return list of available tools"""
+async def list_tools(request: Request, response: Response):
+    """Return list of available tools, honoring If-None-Match"""
+    if request.headers.get("if-none-match") == TOOLS_ETAG:
+        return Response(status_code=304, headers={"ETag": TOOLS_ETAG})
+
+    response.headers["ETag"] = TOOLS_ETAG
     return AVAILABLE_TOOLS
 
 
@@ -79,6 +99,30 @@ async def calculator(request: CalculatorRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+TOOL_HANDLERS = {"calculator": (calculator, CalculatorRequest)}
+
+
+@app.post("/tools/batch")
+async def batch(request: BatchRequest):
+    """Execute several tool calls in one request, results are returned in order"""
+    results = []
+
+    for call in request.calls:
+        if call.tool not in TOOL_HANDLERS:
+            results.append({"error": f"Unknown tool: {call.tool}"})
+            continue
+
+        handler, request_model = TOOL_HANDLERS[call.tool]
+        try:
+            results.append({"result": await handler(request_model(**call.arguments))})
+        except HTTPException as he:
+            results.append({"error": he.detail})
+        except Exception as e:
+            results.append({"error": str(e)})
+
+    return {"results": results}
+
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
@@ -0,0 +1,125 @@
+from typing import Any, Dict, Hashable, Optional, Tuple
+from collections import OrderedDict
+import threading
+import json
+import time
+
+
+class TTLCache:
+    """Thread-safe TTL/LRU cache, keyed on a namespace plus canonical arguments"""
+
+    def __init__(
+        self,
+        ttl: Optional[float] = 3600,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = 16 * 1024 * 1024,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> Optional["TTLCache"]:
+        """Build a cache from a settings block, None if disabled"""
+        if not settings.get("enabled", False):
+            return None
+
+        return cls(
+            ttl=settings.get("ttl", 3600),
+            max_entries=settings.get("max_entries", 1024),
+            max_bytes=settings.get("max_bytes", 16 * 1024 * 1024),
+        )
+
+    @staticmethod
+    def make_key(namespace: str, arguments: Dict[str, Any]) -> Tuple[str, str]:
+        """Key on a namespace plus canonicalized (sorted, compact) JSON arguments"""
+        canonical = json.dumps(
+            arguments, sort_keys=True, separators=(",", ":"), default=str
+        )
+        return namespace, canonical
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        try:
+            return len(json.dumps(value, default=str))
+        except (TypeError, ValueError):
+            return len(str(value))
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value or default, refreshing its LRU position"""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at, _ = entry
+
+            if expires_at and expires_at < time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting least recently used entries over budget"""
+        # Sizing serializes the value, only pay for it when there is a byte budget
+        size = self._sizeof(value) if self.max_bytes else 0
+
+        if self.max_bytes and size > self.max_bytes:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes and self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """Drop cached entries of one namespace, or everything"""
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+
+            for key in [k for k in self._entries if k[0] == namespace]:
+                self._remove(key)
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current usage, bytes only with a budget"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
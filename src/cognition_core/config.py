@@ -1,15 +1,30 @@
 from watchdog.events import FileSystemEventHandler
-from crewai.utilities.paths import db_storage_path
 from pydantic import BaseModel, ValidationError
+from cognition_core.config_sync import RemoteConfigSync
 from cognition_core.logger import logger
 from watchdog.observers import Observer
+from typing import (
+    Callable,
+    Dict,
+    Any,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 from contextlib import contextmanager
-from typing import Dict, Any, Type
+from types import MappingProxyType
 from pathlib import Path
-import subprocess
 import threading
-import shutil
+import hashlib
+import inspect
+import weakref
 import yaml
+import json
 import time
 import os
 
@@ -23,19 +38,215 @@ class ConfigSchema(BaseModel):
     environment: str
 
 
+# libyaml's C loader is an order of magnitude faster when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only, deepcopy it to modify")
+
+
+class FrozenDict(dict):
+    """dict that refuses mutation, deepcopy returns a mutable copy"""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+class FrozenList(list):
+    """list that refuses mutation, deepcopy returns a mutable copy"""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+def freeze(value: Any) -> Any:
+    """Read-only copy of nested dicts and lists"""
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable copy of nested dicts and lists"""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+class ParsedConfigCache:
+    """Parsed YAML keyed by file path and content hash, persisted across processes
+
+    Entries are persisted as JSON so a tampered cache file can at worst yield
+    wrong data, never run code. Configs JSON cannot represent faithfully, such
+    as non-string keys or dates, are only cached in memory.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = cache_dir
+        self.parses = 0
+        self._entries: Dict[Path, Tuple[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _entry_path(self, path: Path) -> Path:
+        name = hashlib.sha1(str(path).encode()).hexdigest()
+        return self.cache_dir / f"{name}.json"
+
+    def _read_entry(self, path: Path) -> Optional[Tuple[str, Any]]:
+        if not self.cache_dir:
+            return None
+
+        try:
+            digest, config = json.loads(self._entry_path(path).read_text())
+            return digest, config
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable config cache entry for {path}: {e}")
+            return None
+
+    def _write_entry(self, path: Path, entry: Tuple[str, Any]):
+        if not self.cache_dir:
+            return
+
+        try:
+            data = json.dumps(entry)
+            # JSON would turn non-string keys into strings, keep those in memory
+            if json.loads(data)[1] != entry[1]:
+                return
+
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            target = self._entry_path(path)
+            tmp = target.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(data)
+            os.replace(tmp, target)
+        except Exception as e:
+            logger.debug(f"Could not persist config cache entry for {path}: {e}")
+
+    def load(self, path: Path) -> Any:
+        """Return the parsed file, re-parsing only when its content changed"""
+        path = path.resolve()
+        data = path.read_bytes()
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+
+        with self._lock:
+            entry = self._entries.get(path) or self._read_entry(path)
+
+            if entry is None or entry[0] != digest:
+                entry = (digest, yaml.load(data, Loader=YAML_LOADER))
+                self.parses += 1
+                self._write_entry(path, entry)
+
+            self._entries[path] = entry
+            return entry[1]
+
+
+class ConfigSnapshot:
+    """Immutable, versioned view of all configs with env overrides precomputed
+
+    Configs are frozen on the way in, so readers share them without being able
+    to change what later readers (or the parse caches) see.
+    """
+
+    __slots__ = ("version", "raw", "resolved", "scoped")
+
+    # Configs with a dedicated env override prefix instead of the CREW_ default
+    ENV_PREFIXES = {"memory": "CREW_MEMORY_", "portkey": "PORTKEY_"}
+
+    def __init__(self, configs: Mapping[str, Dict[str, Any]], version: int = 0):
+        self.version = version
+        self.raw = MappingProxyType(
+            {name: freeze(config) for name, config in configs.items()}
+        )
+        self.resolved = MappingProxyType(
+            {
+                name: freeze(EnvManager.override_config(config))
+                for name, config in configs.items()
+            }
+        )
+        self.scoped = MappingProxyType(
+            {
+                name: freeze(EnvManager.override_config(configs[name], prefix=prefix))
+                for name, prefix in self.ENV_PREFIXES.items()
+                if configs.get(name) is not None
+            }
+        )
+
+    def view(self, name: str) -> Optional[Dict[str, Any]]:
+        """Config as components read it: prefixed env view if any, else CREW_ view"""
+        if name in self.ENV_PREFIXES:
+            return self.scoped.get(name)
+        return self.resolved.get(name)
+
+
+class ConfigChange:
+    """Difference of one named config between two snapshots"""
+
+    __slots__ = ("name", "old", "new", "version", "added", "removed", "modified")
+
+    def __init__(
+        self,
+        name: str,
+        old: Optional[Dict[str, Any]],
+        new: Optional[Dict[str, Any]],
+        version: int,
+    ):
+        old_keys = set(old or {})
+        new_keys = set(new or {})
+        self.name = name
+        self.old = old
+        self.new = new
+        self.version = version
+        self.added = new_keys - old_keys
+        self.removed = old_keys - new_keys
+        self.modified = {key for key in old_keys & new_keys if old[key] != new[key]}
+
+    @property
+    def changed_keys(self) -> Set[str]:
+        return self.added | self.removed | self.modified
+
+
 class ConfigManager:
     def __init__(self):
+        # CrewAI is heavy to import, only pay for it once the manager is needed
+        from crewai.utilities.paths import db_storage_path
+
         self.reload_timeout = float(os.environ.get("CONFIG_RELOAD_TIMEOUT", "0.1"))
         self.last_reload = {}
         self.storage_dir = Path(db_storage_path()).resolve()
         self._cache = {}
+        self._parsed = ParsedConfigCache(self.storage_dir / "config_cache")
+        self._snapshot = ConfigSnapshot({})
+        self._publish_lock = threading.Lock()
+        # Serializes file loads, the sync thread and the watchdog observer both reload
+        self._reload_lock = threading.Lock()
+        self._subscribers = []
+        self._subscribers_lock = threading.Lock()
 
-        # Clone remote repo if specified
+        self._remote_sync = None
+
+        # Reuse or clone the remote config checkout if specified
         remote_config = os.environ.get("COGNITION_CONFIG_SOURCE")
 
         if remote_config:
-            clone_result = self._setup_remote_config(remote_config)
-            if not clone_result:
+            checkout_result = self._setup_remote_config(remote_config)
+            if not checkout_result:
                 logger.error("Failed to clone remote config")
 
         # Set config directory (either local or within cloned repo)
@@ -57,57 +268,140 @@ class ConfigManager:
             self._setup_hot_reload()
             self._load_configs()
 
+            if self._remote_sync:
+                self._remote_sync.start(self._on_remote_change)
+
     def _load_configs(self):
         """Load all YAML configs from config directory"""
-        for config_file in self.config_dir.glob("*.yaml"):
-            logger.debug(f"Loading config file: {config_file}")
-            self._load_file(config_file)
+        with self._reload_lock:
+            for config_file in self.config_dir.glob("*.yaml"):
+                logger.debug(f"Loading config file: {config_file}")
+                self._load_file(config_file)
+
+            self._publish()
+
+    def _publish(self):
+        """Build a new snapshot from the loaded files and swap it in atomically"""
+        with self._publish_lock:
+            previous = self._snapshot
+            self._snapshot = ConfigSnapshot(self._cache, previous.version + 1)
+
+            # Notify under the lock so subscribers see changes in version order
+            self._notify(previous, self._snapshot)
+
+    def subscribe(
+        self,
+        names: Union[str, Iterable[str]],
+        callback: Callable[[ConfigChange], None],
+    ) -> Callable[[], None]:
+        """Call callback with a ConfigChange whenever one of the named configs changes
+
+        Bound methods are held weakly so short-lived services do not leak.
+        Callbacks run on the reloading thread and should return quickly.
+        Returns a function that removes the subscription.
+        """
+        if isinstance(names, str):
+            names = [names]
+
+        if inspect.ismethod(callback):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback  # noqa: E731
 
-    def _setup_remote_config(self, remote_url: str) -> Path:
-        """Clone remote config repository"""
-        try:
-            home_dir = Path.home()
-            config_dir = home_dir / ".cognition"
+        subscription = (frozenset(names), ref)
 
-            logger.info(f"Cloning config from {remote_url} to {config_dir}")
+        with self._subscribers_lock:
+            self._subscribers.append(subscription)
 
-            if config_dir.exists():
-                logger.info(f"Removing existing config directory: {config_dir}")
-                shutil.rmtree(config_dir)
+        def unsubscribe():
+            with self._subscribers_lock:
+                if subscription in self._subscribers:
+                    self._subscribers.remove(subscription)
 
-            result = subprocess.run(
-                ["git", "clone", remote_url, str(config_dir)],
-                capture_output=True,
-                text=True,
-            )
+        return unsubscribe
 
-            if result.returncode != 0:
-                logger.error(f"Git clone failed: {result.stderr}")
-                raise Exception(f"Git clone failed: {result.stderr}")
+    def _notify(self, previous: ConfigSnapshot, current: ConfigSnapshot):
+        """Deliver diffs of changed configs to their subscribers"""
+        with self._subscribers_lock:
+            # Drop subscriptions whose owner has been garbage collected
+            self._subscribers = [
+                sub for sub in self._subscribers if sub[1]() is not None
+            ]
+            subscriptions = list(self._subscribers)
 
-            logger.info(f"Successfully cloned config to {config_dir}")
-            return config_dir
+        for names, ref in subscriptions:
+            callback = ref()
 
-        except Exception as e:
-            logger.error(f"Failed to setup remote config: {e}")
-            return None
+            if callback is None:
+                continue
 
-    def _refresh_remote_config(self):
-        """Update remote config as part of hot reload"""
-        if not self.config_dir or "cognition_config" not in str(self.config_dir):
-            return
+            for name in names:
+                old, new = previous.view(name), current.view(name)
+                if old == new:
+                    continue
+
+                try:
+                    callback(ConfigChange(name, old, new, current.version))
+                except Exception as e:
+                    logger.error(f"Config subscriber for '{name}' failed: {e}")
+
+    @property
+    def version(self) -> int:
+        """Monotonically increasing version of the published config snapshot"""
+        return self._snapshot.version
+
+    def snapshot(self) -> ConfigSnapshot:
+        """Return the current config snapshot for consistent multi-config reads"""
+        return self._snapshot
+
+    def _setup_remote_config(self, remote_url: str) -> Path:
+        """Reuse the persistent config checkout, cloning it only on first use"""
+        checkout_dir = os.environ.get("COGNITION_CONFIG_CHECKOUT", "~/.cognition")
+        interval = float(os.environ.get("COGNITION_CONFIG_SYNC_INTERVAL", "60"))
 
         try:
-            logger.info("Refreshing remote config")
-            result = subprocess.run(
-                ["git", "pull"], cwd=self.config_dir, capture_output=True, text=True
+            self._remote_sync = RemoteConfigSync(
+                remote_url, Path(os.path.expanduser(checkout_dir)), interval
             )
-            if result.returncode == 0:
-                self._load_configs()  # Reload after pull
-            else:
-                logger.error(f"Failed to pull remote config: {result.stderr}")
+            return self._remote_sync.ensure_checkout()
+
         except Exception as e:
-            logger.error(f"Error refreshing remote config: {e}")
+            logger.error(f"Failed to setup remote config: {e}")
+            self._remote_sync = None
+            return None
+
+    def _on_remote_change(self, paths: List[Path]):
+        """Reload the config files a remote sync actually changed"""
+        config_dir = self.config_dir.resolve()
+        changed = [
+            path
+            for path in paths
+            if path.suffix == ".yaml" and path.resolve().parent == config_dir
+        ]
+
+        if changed:
+            self.reload_files(changed)
+
+    def reload_files(self, paths: Iterable[Path]):
+        """Force reload of the given config files and publish one new snapshot
+
+        Files whose content did not change are served from the parsed cache as
+        the same object, a reload that changed nothing publishes nothing.
+        """
+        with self._reload_lock:
+            changed = False
+
+            for path in paths:
+                self.last_reload[path] = 0
+                previous = self._cache.get(path.stem)
+
+                if path.exists():
+                    changed |= self._load_file(path) is not previous
+                else:
+                    changed |= self._cache.pop(path.stem, None) is not None
+
+            if changed:
+                self._publish()
 
     def get_db_password(self) -> str:
         password = os.getenv("LONG_TERM_DB_PASSWORD")
@@ -128,6 +422,8 @@ class ConfigManager:
         self.observer.start()
 
     def __del__(self):
+        if getattr(self, "_remote_sync", None):
+            self._remote_sync.stop()
         if hasattr(self, "observer"):
             self.observer.stop()
             self.observer.join()
@@ -145,21 +441,19 @@ class ConfigManager:
             return self._cache[file_path.stem]
 
         try:
-            with file_path.open() as f:
-                config = yaml.safe_load(f)
-
-                # Additional validation
-                if config is None:
-                    raise ConfigValidationError(f"Empty config file: {file_path}")
-                if not isinstance(config, dict):
-                    raise ConfigValidationError(
-                        f"Invalid YAML structure in {file_path}"
-                    )
-
-                # Force cache update
-                self._cache[file_path.stem] = config
-                self.last_reload[file_path] = current_time
-                return config
+            # Unchanged files are served from the parsed cache without parsing
+            config = self._parsed.load(file_path)
+
+            # Additional validation
+            if config is None:
+                raise ConfigValidationError(f"Empty config file: {file_path}")
+            if not isinstance(config, dict):
+                raise ConfigValidationError(f"Invalid YAML structure in {file_path}")
+
+            # Force cache update
+            self._cache[file_path.stem] = config
+            self.last_reload[file_path] = current_time
+            return config
 
         except (yaml.YAMLError, OSError) as e:
             logger.error(f"Error loading config {file_path}: {str(e)}")
@@ -178,27 +472,18 @@ class ConfigManager:
             raise ConfigValidationError(f"Invalid config {config_name}: {str(e)}")
 
     def get_config(self, name: str, validate: bool = True) -> Dict[str, Any]:
-        """Get config with retry mechanism"""
-        max_retries = 3
-        retry_delay = 0.1
+        """Get a config from the current snapshot, env overrides applied if validate
 
-        for attempt in range(max_retries):
-            try:
-                config = self._cache.get(name)
+        The returned dict is read-only and shared by all readers, deepcopy it
+        for a mutable copy.
+        """
+        snapshot = self._snapshot
+        config = (snapshot.resolved if validate else snapshot.raw).get(name)
 
-                if config is None:
-                    raise KeyError(f"Configuration '{name}' not found")
+        if config is None:
+            raise KeyError(f"Configuration '{name}' not found")
 
-                if validate:
-                    config = EnvManager.override_config(config)
-                return config
-
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise
-
-                time.sleep(retry_delay)
-                continue
+        return config
 
     def get_nested_value(self, config_name: str, path: str, default: Any = None) -> Any:
         """Get nested config value using dot notation (e.g. 'database.host')"""
@@ -217,35 +502,29 @@ class ConfigManager:
         try:
             yield self
         finally:
+            if self._remote_sync:
+                self._remote_sync.stop()
             self.observer.stop()
             self.observer.join()
 
     def get_memory_config(self) -> Dict[str, Any]:
         """Get memory-specific configuration"""
-        try:
-            config = self.get_config("memory", validate=False)
+        config = self._snapshot.scoped.get("memory")
 
-            if not config:
-                logger.warning("Custom memory configuration is empty")
+        if config is None:
+            logger.warning("Memory configuration not found")
+            return None
 
-            return EnvManager.override_config(config, prefix="CREW_MEMORY_")
+        if not config:
+            logger.warning("Custom memory configuration is empty")
 
-        except KeyError:
-            logger.warning("Memory configuration not found")
+        return config
 
     def get_portkey_config(self) -> Dict[str, Any]:
         """Get Portkey-specific configuration"""
-        try:
-            config = self.get_config("portkey", validate=False)
-            if not config:
-                return {
-                    "cache": {
-                        "mode": "semantic",
-                    },
-                    "metadata": {"environment": "development", "project": "cognition"},
-                }
-            return EnvManager.override_config(config, prefix="PORTKEY_")
-        except KeyError:
+        config = self._snapshot.scoped.get("portkey")
+
+        if not config:
             return {
                 "cache": {
                     "mode": "semantic",
@@ -253,6 +532,8 @@ class ConfigManager:
                 "metadata": {"environment": "development", "project": "cognition"},
             }
 
+        return config
+
 
 class EnvManager:
     @staticmethod
@@ -261,40 +542,66 @@ class EnvManager:
 
     @staticmethod
     def override_config(config: dict, prefix: str = "CREW_") -> dict:
+        """Return a copy of config with matching environment variables applied"""
+        overridden = dict(config)
         for key in config:
             env_key = f"{prefix}{key.upper()}"
             if env_key in os.environ:
-                config[key] = os.environ[env_key]
-        return config
+                overridden[key] = os.environ[env_key]
+        return overridden
 
 
 class ConfigReloader(FileSystemEventHandler):
     def __init__(self, config_manager):
         self.config_manager = config_manager
-        self.lock = threading.Lock()
 
     def on_modified(self, event):
         if not event.src_path.endswith(".yaml"):
             return
 
-        with self.lock:
-            try:
-                path = Path(event.src_path)
-                # Force reload by clearing last reload time
-                self.config_manager.last_reload[path] = 0
-                self.config_manager._load_file(path)
-            except Exception as e:
-                logger.error(f"Error reloading config: {str(e)}")
+        # reload_files serializes with the remote sync on the manager's lock
+        try:
+            self.config_manager.reload_files([Path(event.src_path)])
+        except Exception as e:
+            logger.error(f"Error reloading config: {str(e)}")
+
+
+_config_manager: Optional[ConfigManager] = None
+_config_manager_lock = threading.Lock()
+
+
+def get_config_manager() -> ConfigManager:
+    """Return the ConfigManager singleton, creating it on first use"""
+    global _config_manager
+
+    if _config_manager is None:
+        with _config_manager_lock:
+            if _config_manager is None:
+                manager = ConfigManager()
+                _apply_crew_settings(manager)
+                _config_manager = manager
+
+    return _config_manager
+
+
+def _apply_crew_settings(manager: ConfigManager):
+    """Apply process-wide settings from the crew config"""
+    try:
+        crew_config = manager.get_config("crew")
+    except KeyError:
+        return
+
+    if crew_config.get("debug_routellm", False):
+        import litellm
 
+        litellm._turn_on_debug()
 
-# Create the singleton instance
-config_manager = ConfigManager()
-crew_config = config_manager.get_config("crew")
 
-if crew_config.get("debug_routellm", False):
-    import litellm
+def __getattr__(name: str) -> Any:
+    # Keep `from cognition_core.config import config_manager` working, lazily
+    if name == "config_manager":
+        return get_config_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    litellm._turn_on_debug()
 
-# Export only the singleton instance
-__all__ = ["config_manager"]
+__all__ = ["config_manager", "get_config_manager"]
@@ -0,0 +1,115 @@
+from cognition_core.logger import logger
+from typing import Callable, List, Optional
+from pathlib import Path
+import subprocess
+import threading
+import shutil
+
+logger = logger.getChild(__name__)
+
+
+class RemoteConfigError(Exception):
+    pass
+
+
+class RemoteConfigSync:
+    """Keep a persistent local checkout of a remote config repository up to date"""
+
+    def __init__(self, remote_url: str, checkout_dir: Path, interval: float = 60.0):
+        self.remote_url = remote_url
+        self.checkout_dir = Path(checkout_dir)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _git(self, *args: str, cwd: Optional[Path] = None) -> str:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=cwd or self.checkout_dir,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RemoteConfigError(f"git {args[0]} failed: {result.stderr.strip()}")
+        return result.stdout.strip()
+
+    def ensure_checkout(self) -> Path:
+        """Reuse the existing checkout, cloning only when missing or pointing elsewhere"""
+        if (self.checkout_dir / ".git").exists():
+            try:
+                origin = self._git("remote", "get-url", "origin")
+            except RemoteConfigError:
+                origin = None
+
+            if origin == self.remote_url:
+                logger.debug(f"Reusing config checkout at {self.checkout_dir}")
+                return self.checkout_dir
+
+            logger.info(f"Config checkout tracks {origin}, recloning {self.remote_url}")
+
+        if self.checkout_dir.exists():
+            shutil.rmtree(self.checkout_dir)
+
+        self.checkout_dir.parent.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Cloning config from {self.remote_url} to {self.checkout_dir}")
+
+        # Partial clone: commits and trees only, blobs are fetched on checkout
+        self._git(
+            "clone",
+            "--quiet",
+            "--filter=blob:none",
+            "--single-branch",
+            "--no-tags",
+            self.remote_url,
+            str(self.checkout_dir),
+            cwd=self.checkout_dir.parent,
+        )
+        return self.checkout_dir
+
+    def sync(self) -> List[Path]:
+        """Fetch and fast-forward the checkout, returning the files that changed"""
+        self._git("fetch", "--quiet", "--no-tags", "origin")
+        head = self._git("rev-parse", "HEAD")
+        upstream = self._git("rev-parse", "@{u}")
+
+        if head == upstream:
+            return []
+
+        changed = self._git("diff", "--name-only", head, upstream).splitlines()
+
+        try:
+            self._git("merge", "--quiet", "--ff-only", upstream)
+        except RemoteConfigError:
+            logger.warning("Remote config history diverged, resetting to upstream")
+            self._git("reset", "--quiet", "--hard", upstream)
+
+        logger.info(f"Synced remote config to {upstream[:8]}: {changed}")
+        return [self.checkout_dir / name for name in changed if name]
+
+    def start(self, on_change: Callable[[List[Path]], None]):
+        """Sync now and then every interval seconds on a background thread"""
+        if self._thread is not None or not self.interval:
+            return
+
+        def run():
+            while True:
+                try:
+                    changed = self.sync()
+                    if changed:
+                        on_change(changed)
+                except Exception as e:
+                    logger.error(f"Error syncing remote config: {e}")
+
+                if self._stop.wait(self.interval):
+                    return
+
+        self._thread = threading.Thread(
+            target=run, name="cognition-config-sync", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -1,5 +1,5 @@
 from cognition_core.tools.tool_svc import ToolService, CognitionToolsHandler
-from cognition_core.config import config_manager as ConfigManager
+from cognition_core.config import get_config_manager
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from cognition_core.memory.mem_svc import MemoryService
 from cognition_core.agent import CognitionAgent
@@ -10,8 +10,6 @@ from crewai.project import CrewBase
 from crewai.tools import BaseTool
 from crewai import Crew, Task
 from pathlib import Path
-import asyncio
-
 
 T = TypeVar("T", bound=type)
 
@@ -21,7 +19,7 @@ def CognitionCoreCrewBase(cls: T) -> T:
     """Enhanced CrewBase decorator with Cognition-specific functionality"""
 
     # Initialize config before class wrapping
-    config_manager = ConfigManager
+    config_manager = get_config_manager()
 
     # Set config paths before CrewBase wrapping
     if config_manager.config_dir:
@@ -35,18 +33,21 @@ def CognitionCoreCrewBase(cls: T) -> T:
         def __init__(self, *args, **kwargs):
             # Initialize services
             self.memory_service = MemoryService(config_manager)
-            self.tool_service = ToolService()
-            self.portkey_config = config_manager.get_portkey_config()
 
-            # Initialize tool service
-            asyncio.run(self.setup())
+            # Shared registry, loaded once and refreshed in the background
+            self.tool_service = ToolService.shared()
 
             # Initialize parent last
             super().__init__(*args, **kwargs)
 
-        async def setup(self):
-            """Initialize services including tool loading"""
-            await self.tool_service.initialize()
+        def close(self):
+            """Release the memories built for this crew"""
+            self.memory_service.close()
+
+        @property
+        def portkey_config(self):
+            """Current Portkey config, follows config reloads"""
+            return config_manager.get_portkey_config()
 
         def get_tool(self, name: str):
             """Get a specific tool by name"""
@@ -58,11 +59,10 @@ def CognitionCoreCrewBase(cls: T) -> T:
 
         def get_cognition_agent(self, config: dict, **kwargs) -> CognitionAgent:
             """Create a CognitionAgent with tools from service."""
-            available_tools = self.tool_service.list_tools()
+            registry = self.tool_service.snapshot()
+            available_tools = registry.names()
 
-            tool_instances = [
-                self.tool_service.get_tool(name) for name in available_tools
-            ]
+            tool_instances = [registry.get(name) for name in available_tools]
 
             if kwargs.get("tools"):
                 incoming_tools = kwargs.get("tools")
@@ -1,4 +1,4 @@
-from cognition_core.config import config_manager
+from cognition_core.config import get_config_manager
 from typing import Optional, TypeVar, Any
 from pydantic import Field, ConfigDict
 from crewai.flow.flow import Flow
@@ -25,7 +25,7 @@ class CognitionFlow(Flow):
     ):
         # Load flow config
         self._config_data = (
-            config_manager.load_config(config_path) if config_path else {}
+            get_config_manager().load_config(config_path) if config_path else {}
         )
 
         # Initialize parent classes
@@ -49,7 +49,7 @@ class CognitionFlow(Flow):
     @classmethod
     def from_config(cls, config_path: str) -> "CognitionFlow":
         """Create flow instance from configuration file"""
-        config = config_manager.load_config(config_path)
+        config = get_config_manager().load_config(config_path)
         return cls(
             name=config.get("name", "default_flow"),
             enabled=config.get("enabled", True),
@@ -1,4 +1,4 @@
-from colorama import Fore, Style, init
+from colorama import Fore, Style, just_fix_windows_console
 from datetime import datetime
 from typing import Optional
 from pathlib import Path
@@ -7,8 +7,8 @@ import sys
 import os
 
 
-# Initialize colorama
-init()
+# Enable ANSI colors on Windows consoles, no-op elsewhere
+just_fix_windows_console()
 LOGGER_NAME = "COG"
 
 # Define log levels
@@ -48,6 +48,17 @@ class ColoredFormatter(logging.Formatter):
         return f"{color}{formatted_msg}{Style.RESET_ALL}"
 
 
+class DeferredFileHandler(logging.FileHandler):
+    """File handler that creates its directory and file on the first record"""
+
+    def __init__(self, filename: Path):
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
 class LoggerSetup:
     """Setup logging configuration for the entire application"""
 
@@ -93,10 +104,9 @@ class LoggerSetup:
         )
         self.logger.addHandler(console_handler)
 
-        # File handler
+        # File handler, the log file is only created once something is logged
         try:
-            self.log_file.parent.mkdir(exist_ok=True)
-            file_handler = logging.FileHandler(self.log_file)
+            file_handler = DeferredFileHandler(self.log_file)
             file_handler.setFormatter(
                 logging.Formatter(
                     "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -0,0 +1,165 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from collections import OrderedDict
+from pathlib import Path
+import unicodedata
+import threading
+import hashlib
+import sqlite3
+import numpy as np
+import json
+
+_shared: Dict[str, "EmbeddingCache"] = {}
+_shared_lock = threading.Lock()
+
+
+def embedder_fingerprint(embedder_config: Optional[Dict[str, Any]]) -> str:
+    """Stable digest of an embedder config, so providers and models never mix"""
+    canonical = json.dumps(
+        embedder_config,
+        sort_keys=True,
+        default=lambda value: type(value).__qualname__,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class EmbeddingCache:
+    """Content-addressed embedding cache: in-memory LRU over a float32 SQLite store"""
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_entries: int = 4096,
+    ):
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._db.commit()
+
+    @classmethod
+    def from_settings(
+        cls, settings: Optional[Dict[str, Any]], default_path: Path
+    ) -> Optional["EmbeddingCache"]:
+        """Return the process-wide cache for the memory `embedding_cache` block"""
+        if not settings or not settings.get("enabled", False):
+            return None
+
+        path = None
+        if settings.get("persist", True):
+            path = Path(settings.get("path") or default_path).expanduser()
+
+        with _shared_lock:
+            key = str(path)
+            if key not in _shared:
+                _shared[key] = cls(path, settings.get("max_entries", 4096))
+            return _shared[key]
+
+    @staticmethod
+    def make_key(fingerprint: str, text: str) -> str:
+        digest = hashlib.sha256(normalize_text(text).encode()).hexdigest()
+        return f"{fingerprint}:{digest}"
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Look keys up in memory, then on disk, promoting disk hits"""
+        with self._lock:
+            found = [self._memory.get(key) for key in keys]
+            for key, vector in zip(keys, found):
+                if vector is not None:
+                    self._memory.move_to_end(key)
+
+            missing = [key for key, vector in zip(keys, found) if vector is None]
+            if missing and self._db is not None:
+                placeholders = ",".join("?" * len(missing))
+                rows = self._db.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    missing,
+                ).fetchall()
+                stored = {
+                    key: np.frombuffer(blob, dtype=np.float32) for key, blob in rows
+                }
+
+                for index, key in enumerate(keys):
+                    if found[index] is None and key in stored:
+                        found[index] = stored[key]
+                        self._remember(key, stored[key])
+
+            hits = sum(vector is not None for vector in found)
+            self.hits += hits
+            self.misses += len(keys) - hits
+            return found
+
+    def put_many(self, keys: Sequence[str], vectors: Sequence[Any]) -> None:
+        packed = [np.asarray(vector, dtype=np.float32) for vector in vectors]
+
+        with self._lock:
+            for key, vector in zip(keys, packed):
+                self._remember(key, vector)
+
+            if self._db is not None:
+                with self._db:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                        [(key, vector.tobytes()) for key, vector in zip(keys, packed)],
+                    )
+
+    def embed(
+        self,
+        texts: Sequence[str],
+        embed: Callable[[List[str]], Sequence[Any]],
+        fingerprint: str,
+    ) -> List[np.ndarray]:
+        """Embed texts, calling embed only once for the distinct cache misses"""
+        keys = [self.make_key(fingerprint, text) for text in texts]
+        vectors = self.get_many(keys)
+
+        pending: Dict[str, str] = {}
+        for key, text, vector in zip(keys, texts, vectors):
+            if vector is None and key not in pending:
+                pending[key] = text
+
+        if pending:
+            computed = embed(list(pending.values()))
+            self.put_many(list(pending), computed)
+            fresh = dict(zip(pending, (np.asarray(v, np.float32) for v in computed)))
+            vectors = [
+                vector if vector is not None else fresh[key]
+                for key, vector in zip(keys, vectors)
+            ]
+
+        return vectors
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._memory),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
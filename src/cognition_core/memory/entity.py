@@ -4,7 +4,20 @@ from cognition_core.memory.storage import ChromaRAGStorage
 
 class CustomEntityMemory(EntityMemory):
     def __init__(
-        self, host: str, port: int, collection_name: str, embedder_config=None
+        self,
+        host: str,
+        port: int,
+        collection_name: str,
+        embedder_config=None,
+        settings=None,
+        embedding_cache=None,
     ):
-        storage = ChromaRAGStorage(host, port, collection_name, embedder_config)
+        storage = ChromaRAGStorage(
+            host,
+            port,
+            collection_name,
+            embedder_config,
+            settings=settings,
+            embedding_cache=embedding_cache,
+        )
         super().__init__(storage=storage)
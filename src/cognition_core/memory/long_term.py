@@ -1,12 +1,67 @@
 from crewai.memory.long_term.long_term_memory_item import LongTermMemoryItem
 from crewai.memory.long_term.long_term_memory import LongTermMemory
-from psycopg2.extras import DictCursor
+from cognition_core.memory.write_behind import WriteBehindBuffer
+from cognition_core.memory.pool import PostgresConnectionPool
+from psycopg2.extras import DictCursor, execute_values
+from typing import Dict, List, Any, Optional, Set
 from crewai.utilities import Printer
 from datetime import datetime as dt
-from typing import Dict, List, Any
-import psycopg2
+import threading
 import json
 
+# Arbitrary key for pg_advisory_xact_lock, shared by every process migrating LTM
+MIGRATION_LOCK_ID = 7_204_118_031
+
+# Connection strings this process has already brought up to date
+_migrated: Set[str] = set()
+_migrated_lock = threading.Lock()
+
+# Append-only: (version, description, statements). Never edit applied entries.
+MIGRATIONS = [
+    (
+        1,
+        "create long_term_memories",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS long_term_memories (
+                id SERIAL PRIMARY KEY,
+                task_description TEXT,
+                metadata JSONB,
+                datetime TEXT,
+                score FLOAT
+            )
+            """,
+        ],
+    ),
+    (
+        2,
+        "timestamptz created_at with latest-first index",
+        [
+            "ALTER TABLE long_term_memories ADD COLUMN IF NOT EXISTS created_at "
+            "TIMESTAMPTZ",
+            # Rows written before this migration only have the naive ISO text
+            # column, in the writer's local time: read it in the configured zone
+            # rather than the session's
+            "UPDATE long_term_memories SET created_at = datetime::timestamp "
+            "AT TIME ZONE current_setting('cognition.ltm_timezone') "
+            "WHERE created_at IS NULL",
+            "ALTER TABLE long_term_memories ALTER COLUMN created_at SET DEFAULT now()",
+            "ALTER TABLE long_term_memories ALTER COLUMN created_at SET NOT NULL",
+            "CREATE INDEX IF NOT EXISTS long_term_memories_created_at_idx "
+            "ON long_term_memories (created_at DESC, id DESC)",
+        ],
+    ),
+    (
+        3,
+        "trigram index for substring task search",
+        [
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+            "CREATE INDEX IF NOT EXISTS long_term_memories_task_trgm_idx "
+            "ON long_term_memories USING gin (task_description gin_trgm_ops)",
+        ],
+    ),
+]
+
 
 class LTMPostgresStorage:
     """PostgreSQL storage class for LTM data storage."""
@@ -14,34 +69,81 @@ class LTMPostgresStorage:
     def __init__(
         self,
         connection_string: str,
+        pool_settings: Optional[Dict[str, Any]] = None,
+        pool: Optional[PostgresConnectionPool] = None,
+        timezone: Optional[str] = None,
     ) -> None:
         self.connection_string = connection_string
+        # Zone of the hosts that wrote the naive `datetime` text of existing rows
+        self.timezone = timezone or "UTC"
+        # Storages on the same database share one pool, released on close
+        self._shared_pool = pool is None
+        self._released = False
+        self.pool = pool or PostgresConnectionPool.shared(
+            connection_string, pool_settings
+        )
         self._printer = Printer()
         self._initialize_db()
 
     def _initialize_db(self):
-        """Initialize the PostgreSQL database and create LTM table."""
+        """Bring the LTM schema up to date, once per database and process."""
+        with _migrated_lock:
+            if self.connection_string in _migrated:
+                return
+            self._migrate()
+
+    def _migrate(self):
         try:
-            with psycopg2.connect(self.connection_string) as conn:
+            with self.pool.connection() as conn:
                 with conn.cursor() as cursor:
                     cursor.execute(
                         """
-                        CREATE TABLE IF NOT EXISTS long_term_memories (
-                            id SERIAL PRIMARY KEY,
-                            task_description TEXT,
-                            metadata JSONB,
-                            datetime TEXT,
-                            score FLOAT
+                        CREATE TABLE IF NOT EXISTS long_term_memory_migrations (
+                            version INTEGER PRIMARY KEY,
+                            description TEXT,
+                            applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
                         )
                         """
                     )
-                conn.commit()
+
+            for version, description, statements in MIGRATIONS:
+                self._apply_migration(version, description, statements)
+
+            _migrated.add(self.connection_string)
         except Exception as e:
             self._printer.print(
                 content=f"MEMORY ERROR: Database initialization failed: {e}",
                 color="red",
             )
 
+    def _apply_migration(self, version: int, description: str, statements: List[str]):
+        """Apply one migration in its own transaction unless already recorded"""
+        with self.pool.connection() as conn:
+            with conn.cursor() as cursor:
+                # Serialize concurrent starters, the lock ends with the transaction
+                cursor.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+                cursor.execute(
+                    "SELECT 1 FROM long_term_memory_migrations WHERE version = %s",
+                    (version,),
+                )
+                if cursor.fetchall():
+                    return
+
+                cursor.execute(
+                    "SELECT set_config('cognition.ltm_timezone', %s, true)",
+                    (self.timezone,),
+                )
+                for statement in statements:
+                    cursor.execute(statement)
+
+                cursor.execute(
+                    """
+                    INSERT INTO long_term_memory_migrations (version, description)
+                    VALUES (%s, %s)
+                    """,
+                    (version, description),
+                )
+
     def save(
         self,
         task_description: str,
@@ -53,38 +155,65 @@ class LTMPostgresStorage:
             # Convert Unix timestamp to ISO format
             formatted_datetime = dt.fromtimestamp(float(datetime)).isoformat()
 
-            with psycopg2.connect(self.connection_string) as conn:
+            with self.pool.connection() as conn:
                 with conn.cursor() as cursor:
                     cursor.execute(
                         """
-                        INSERT INTO long_term_memories 
-                        (task_description, metadata, datetime, score)
-                        VALUES (%s, %s, %s, %s)
+                        INSERT INTO long_term_memories
+                        (task_description, metadata, datetime, score, created_at)
+                        VALUES (%s, %s, %s, %s, to_timestamp(%s))
                         """,
                         (
                             task_description,
                             json.dumps(metadata),
                             formatted_datetime,
                             score,
+                            float(datetime),
                         ),
                     )
-                conn.commit()
         except Exception as e:
             self._printer.print(
                 content=f"MEMORY ERROR: Save operation failed: {e}",
                 color="red",
             )
 
+    def save_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert several memories with one multi-row INSERT, raising on failure"""
+        values = [
+            (
+                row["task_description"],
+                json.dumps(row["metadata"]),
+                dt.fromtimestamp(float(row["datetime"])).isoformat(),
+                row["score"],
+                float(row["datetime"]),
+            )
+            for row in rows
+        ]
+
+        with self.pool.connection() as conn:
+            with conn.cursor() as cursor:
+                execute_values(
+                    cursor,
+                    """
+                    INSERT INTO long_term_memories
+                    (task_description, metadata, datetime, score, created_at)
+                    VALUES %s
+                    """,
+                    values,
+                    template="(%s, %s, %s, %s, to_timestamp(%s))",
+                    page_size=len(values) or 1,
+                )
+
     def load(self, task_description: str, latest_n: int) -> List[Dict[str, Any]]:
         try:
-            with psycopg2.connect(self.connection_string) as conn:
+            with self.pool.connection() as conn:
                 with conn.cursor(cursor_factory=DictCursor) as cursor:
                     cursor.execute(
                         """
                         SELECT task_description, metadata, datetime, score
                         FROM long_term_memories
                         WHERE task_description LIKE %s
-                        ORDER BY datetime DESC
+                        ORDER BY created_at DESC, id DESC
                         LIMIT %s
                         """,
                         (f"%{task_description}%", latest_n),
@@ -108,34 +237,77 @@ class LTMPostgresStorage:
 
     def reset(self) -> None:
         try:
-            with psycopg2.connect(self.connection_string) as conn:
+            with self.pool.connection() as conn:
                 with conn.cursor() as cursor:
                     cursor.execute("DELETE FROM long_term_memories")
-                conn.commit()
         except Exception as e:
             self._printer.print(
                 content=f"MEMORY ERROR: Reset operation failed: {e}",
                 color="red",
             )
 
+    def close(self) -> None:
+        if not self._shared_pool:
+            self.pool.close()
+        elif not self._released:
+            self._released = True
+            self.pool.release()
+
 
 # Remove BaseStorageHandler and ExternalSQLHandler classes
 # Keep CustomLongTermMemory but simplify it
 class CustomLongTermMemory(LongTermMemory):
-    def __init__(self, connection_string: str, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.storage = LTMPostgresStorage(connection_string)
+    def __init__(
+        self,
+        connection_string: Optional[str] = None,
+        *args,
+        pool_settings: Optional[Dict[str, Any]] = None,
+        write_behind: Optional[Dict[str, Any]] = None,
+        storage: Optional[Any] = None,
+        timezone: Optional[str] = None,
+        **kwargs,
+    ):
+        # Any storage with the LTMPostgresStorage save/save_many/load/reset surface
+        storage = storage or LTMPostgresStorage(
+            connection_string, pool_settings, timezone=timezone
+        )
+        super().__init__(*args, storage=storage, **kwargs)
+
+        # Saves are queued and inserted in batches off the agent's critical path
+        self.writer = WriteBehindBuffer.from_settings(
+            self.storage.save_many, write_behind or {}
+        )
 
     def save(self, item: LongTermMemoryItem):
         metadata = item.metadata.copy()
         metadata.update({"agent": item.agent, "expected_output": item.expected_output})
+        row = {
+            "task_description": item.task,
+            "metadata": metadata,
+            "datetime": item.datetime,
+            "score": metadata.get("quality", 0.0),
+        }
 
-        self.storage.save(
-            task_description=item.task,
-            metadata=metadata,
-            datetime=item.datetime,
-            score=metadata.get("quality", 0.0),
-        )
+        if self.writer is not None:
+            self.writer.put(row)
+            return
+
+        self.storage.save(**row)
 
     def search(self, task: str, latest_n: int = 3) -> List[Dict]:
+        # Read your own writes: land anything still queued before searching
+        self.flush()
         return self.storage.load(task, latest_n)
+
+    def reset(self) -> None:
+        self.flush()
+        self.storage.reset()
+
+    def flush(self) -> None:
+        if self.writer is not None:
+            self.writer.flush()
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        self.storage.close()
@@ -0,0 +1,187 @@
+from typing import Any, Dict, Iterable, List, Union
+from crewai.utilities import Printer
+from datetime import datetime as dt
+from pathlib import Path
+import threading
+import sqlite3
+import json
+
+# Trigram FTS5 gives LIKE '%...%' semantics but needs at least three characters
+TRIGRAM_MIN_CHARS = 3
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS long_term_memories (
+        id INTEGER PRIMARY KEY,
+        task_description TEXT NOT NULL,
+        metadata TEXT,
+        datetime TEXT,
+        created_at REAL NOT NULL,
+        score REAL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS long_term_memories_created_at_idx
+    ON long_term_memories (created_at DESC)
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS long_term_memories_fts USING fts5(
+        task_description,
+        content='long_term_memories',
+        content_rowid='id',
+        tokenize='trigram'
+    )
+    """,
+    # Keep the external-content FTS index in step with the base table
+    """
+    CREATE TRIGGER IF NOT EXISTS long_term_memories_ai
+    AFTER INSERT ON long_term_memories BEGIN
+        INSERT INTO long_term_memories_fts (rowid, task_description)
+        VALUES (new.id, new.task_description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS long_term_memories_ad
+    AFTER DELETE ON long_term_memories BEGIN
+        INSERT INTO long_term_memories_fts
+        (long_term_memories_fts, rowid, task_description)
+        VALUES ('delete', old.id, old.task_description);
+    END
+    """,
+]
+
+INSERT_SQL = """
+    INSERT INTO long_term_memories
+    (task_description, metadata, datetime, created_at, score)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+SEARCH_SQL = """
+    SELECT m.task_description, m.metadata, m.datetime, m.score
+    FROM long_term_memories_fts f
+    JOIN long_term_memories m ON m.id = f.rowid
+    WHERE long_term_memories_fts MATCH ?
+    ORDER BY m.created_at DESC, m.id DESC
+    LIMIT ?
+"""
+
+# Queries too short for trigrams fall back to a scan of the newest rows
+SCAN_SQL = """
+    SELECT task_description, metadata, datetime, score
+    FROM long_term_memories
+    WHERE instr(lower(task_description), lower(?)) > 0
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+"""
+
+
+class LTMSQLiteFTSStorage:
+    """Embedded SQLite (WAL + FTS5) storage class for LTM data storage."""
+
+    def __init__(self, db_path: Union[str, Path], busy_timeout: float = 5.0) -> None:
+        self.db_path = Path(db_path)
+        self._printer = Printer()
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # sqlite3 keeps prepared statements per connection, so reuse one
+        self._conn = sqlite3.connect(
+            self.db_path,
+            timeout=busy_timeout,
+            check_same_thread=False,
+            cached_statements=64,
+        )
+        self._initialize_db()
+
+    def _initialize_db(self):
+        """Enable WAL and create the LTM table with its FTS5 index."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                for statement in SCHEMA:
+                    self._conn.execute(statement)
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"MEMORY ERROR: Database initialization failed: {e}",
+                color="red",
+            )
+
+    @staticmethod
+    def _row(
+        task_description: str, metadata: Dict[str, Any], datetime: str, score: float
+    ) -> tuple:
+        timestamp = float(datetime)
+        return (
+            task_description,
+            json.dumps(metadata),
+            dt.fromtimestamp(timestamp).isoformat(),
+            timestamp,
+            score,
+        )
+
+    def save(
+        self,
+        task_description: str,
+        metadata: Dict[str, Any],
+        datetime: str,
+        score: float,
+    ) -> None:
+        try:
+            row = self._row(task_description, metadata, datetime, score)
+            with self._lock, self._conn:
+                self._conn.execute(INSERT_SQL, row)
+        except (sqlite3.Error, ValueError) as e:
+            self._printer.print(
+                content=f"MEMORY ERROR: Save operation failed: {e}",
+                color="red",
+            )
+
+    def save_many(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Insert several memories in a single transaction, raising on failure"""
+        values = [self._row(**row) for row in rows]
+
+        with self._lock, self._conn:
+            self._conn.executemany(INSERT_SQL, values)
+
+    def load(self, task_description: str, latest_n: int) -> List[Dict[str, Any]]:
+        try:
+            if len(task_description) >= TRIGRAM_MIN_CHARS:
+                # Quote as an FTS5 phrase so the text is matched, not parsed
+                phrase = '"' + task_description.replace('"', '""') + '"'
+                query, params = SEARCH_SQL, (phrase, latest_n)
+            else:
+                query, params = SCAN_SQL, (task_description, latest_n)
+
+            with self._lock:
+                rows = self._conn.execute(query, params).fetchall()
+
+            return [
+                {
+                    "task": task,
+                    "metadata": json.loads(metadata) if metadata else {},
+                    "datetime": datetime,
+                    "score": score,
+                }
+                for task, metadata, datetime, score in rows
+            ]
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"MEMORY ERROR: Load operation failed: {e}",
+                color="red",
+            )
+            return []
+
+    def reset(self) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM long_term_memories")
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"MEMORY ERROR: Reset operation failed: {e}",
+                color="red",
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,12 +1,18 @@
+from cognition_core.memory.long_term_sqlite import LTMSQLiteFTSStorage
+from cognition_core.memory.embedding_cache import EmbeddingCache
+from cognition_core.memory.vector_store import NumpyVectorStorage
 from cognition_core.memory.short_term import CustomShortTermMemory
 from crewai.memory.long_term.long_term_memory import LongTermMemory
 from cognition_core.memory.long_term import CustomLongTermMemory
 from cognition_core.memory.short_term import ShortTermMemory
 from crewai.memory.entity.entity_memory import EntityMemory
 from cognition_core.memory.entity import CustomEntityMemory
-from cognition_core.config import ConfigManager
+from cognition_core.config import ConfigChange, ConfigManager
 from cognition_core.logger import logger
+from typing import Optional
+from pathlib import Path
 import logging
+import os
 
 logger = logger.getChild(__name__)
 logger.setLevel(logging.DEBUG)
@@ -27,6 +33,17 @@ class MemoryService:
             },
         }
 
+        # Memories holding threads or connections, closed with the service
+        self._memories = []
+
+        self._initialize_config()
+
+        # Pick up memory.yaml changes without rebuilding the service
+        self.config_manager.subscribe("memory", self._on_config_change)
+
+    def _on_config_change(self, change: ConfigChange):
+        """Re-read memory configuration after a reload"""
+        logger.debug(f"Memory configuration changed: {sorted(change.changed_keys)}")
         self._initialize_config()
 
     def get_storage_path(self) -> str:
@@ -80,6 +97,19 @@ class MemoryService:
             logger.debug("Long term memory configuration deactivated")
             return
 
+        if settings.get("backend") == "sqlite":
+            # embedded sqlite with WAL and an FTS5 index, no database server
+            db_path = settings.get("path") or (
+                self.storage_path / "long_term_memory_fts.db"
+            )
+            memory = CustomLongTermMemory(
+                storage=LTMSQLiteFTSStorage(os.path.expanduser(db_path)),
+                write_behind=settings.get("write_behind"),
+            )
+            logger.debug(f"Long term memory: SQLite FTS5 at {db_path}")
+            self._memories.append(memory)
+            return memory
+
         if is_active and is_external:
             # upstream connection string
             connection_string = settings.get("connection_string", None)
@@ -95,8 +125,14 @@ class MemoryService:
                 "your_password", self.config_manager.get_db_password()
             )
 
-            memory = CustomLongTermMemory(connection_string)
+            memory = CustomLongTermMemory(
+                connection_string,
+                pool_settings=settings.get("pool"),
+                write_behind=settings.get("write_behind"),
+                timezone=settings.get("timezone"),
+            )
             logger.debug(f"Long term memory: {memory.__class__.__name__}")
+            self._memories.append(memory)
             return memory
 
         if is_active and not is_external:
@@ -119,6 +155,14 @@ class MemoryService:
             logger.debug("Short term memory configuration deactivated")
             return
 
+        if settings.get("backend") == "numpy":
+            memory = ShortTermMemory(
+                storage=self._get_vector_storage(settings, "short_term")
+            )
+            logger.debug("Short term memory: in-process NumPy vector store")
+            self._memories.append(memory)
+            return memory
+
         if is_active and is_external:
             host = settings.get("host")
             port = settings.get("port")
@@ -133,8 +177,11 @@ class MemoryService:
                 port=port,
                 collection_name=collection_name,
                 embedder_config=self.get_embedder_config(),
+                settings=settings,
+                embedding_cache=self.get_embedding_cache(),
             )
             logger.debug(f"Short term memory: {memory.__class__.__name__}")
+            self._memories.append(memory)
             return memory
 
         return self.__init_default_short_term_memory()
@@ -154,6 +201,14 @@ class MemoryService:
             logger.debug("Entity memory configuration deactivated")
             return
 
+        if settings.get("backend") == "numpy":
+            memory = EntityMemory(
+                storage=self._get_vector_storage(settings, "entities")
+            )
+            logger.debug("Entity memory: in-process NumPy vector store")
+            self._memories.append(memory)
+            return memory
+
         if is_active and is_external:
             host = settings.get("host")
             port = settings.get("port")
@@ -168,12 +223,50 @@ class MemoryService:
                 port=port,
                 collection_name=collection_name,
                 embedder_config=self.get_embedder_config(),
+                settings=settings,
+                embedding_cache=self.get_embedding_cache(),
             )
             logger.debug(f"Entity memory: {memory.__class__.__name__}")
+            self._memories.append(memory)
             return memory
 
         return self.__init_default_entity_memory()
 
+    def _get_vector_storage(
+        self, settings: dict, default_collection: str
+    ) -> NumpyVectorStorage:
+        """In-process vector store persisted under the memory storage path"""
+        collection_name = settings.get("collection_name", default_collection)
+        path = settings.get("path") or (
+            Path(self.storage_path) / "vector_store" / collection_name
+        )
+        return NumpyVectorStorage(
+            collection_name,
+            Path(path).expanduser(),
+            embedder_config=self.get_embedder_config(),
+            mmap=settings.get("mmap", False),
+            embedding_cache=self.get_embedding_cache(),
+        )
+
+    def get_embedding_cache(self) -> Optional[EmbeddingCache]:
+        """Embedding cache shared by short term and entity memory, None if off"""
+        return EmbeddingCache.from_settings(
+            self.memory_config.get("embedding_cache"),
+            Path(self.storage_path) / "embedding_cache.db",
+        )
+
+    def close(self):
+        """Flush and close the memories built by this service"""
+        memories, self._memories = self._memories, []
+
+        for memory in memories:
+            # Long term memories close themselves, vector ones via their storage
+            close = getattr(memory, "close", None) or memory.storage.close
+            try:
+                close()
+            except Exception as e:
+                logger.error(f"Failed to close {memory.__class__.__name__}: {e}")
+
     def get_embedder_config(self):
         """Get embedder configuration"""
         embedder_settings = self.memory_config.get("embedder", self.embedder)
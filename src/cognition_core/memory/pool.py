@@ -0,0 +1,243 @@
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+from contextlib import contextmanager
+from cognition_core.logger import logger
+from collections import deque
+import threading
+import psycopg2
+import time
+
+logger = logger.getChild(__name__)
+
+_shared: Dict[str, "PostgresConnectionPool"] = {}
+_shared_lock = threading.Lock()
+
+
+class PoolTimeoutError(Exception):
+    pass
+
+
+class PostgresConnectionPool:
+    """Thread-safe PostgreSQL connection pool with health checks and idle recycling"""
+
+    def __init__(
+        self,
+        connection_string: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        max_idle: float = 300.0,
+        max_lifetime: Optional[float] = 3600.0,
+        health_check_interval: float = 30.0,
+        connect: Callable[[str], Any] = psycopg2.connect,
+    ):
+        self.connection_string = connection_string
+        self.min_size = min_size
+        self.max_size = max(max_size, 1)
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+        self._connect = connect
+        self._size = 0
+        self._refs = 0
+        self._closed = False
+        # (connection, created_at, returned_at), most recently returned last
+        self._idle: Deque[Tuple[Any, float, float]] = deque()
+        self._created: Dict[int, float] = {}
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_settings(
+        cls, connection_string: str, settings: Optional[Dict[str, Any]] = None
+    ) -> "PostgresConnectionPool":
+        """Build a pool from the `long_term_memory.pool` block of memory.yaml"""
+        settings = settings or {}
+        return cls(
+            connection_string,
+            min_size=settings.get("min_size", 1),
+            max_size=settings.get("max_size", 10),
+            timeout=settings.get("timeout", 30.0),
+            max_idle=settings.get("max_idle", 300.0),
+            max_lifetime=settings.get("max_lifetime", 3600.0),
+            health_check_interval=settings.get("health_check_interval", 30.0),
+        )
+
+    @classmethod
+    def shared(
+        cls, connection_string: str, settings: Optional[Dict[str, Any]] = None
+    ) -> "PostgresConnectionPool":
+        """Process-wide pool for a connection string, pair each call with release
+
+        Settings only apply when the pool is created, later callers share it as is.
+        """
+        with _shared_lock:
+            pool = _shared.get(connection_string)
+            if pool is None or pool._closed:
+                pool = cls.from_settings(connection_string, settings)
+                _shared[connection_string] = pool
+            pool._refs += 1
+            return pool
+
+    def release(self):
+        """Drop a reference taken with shared, the last one closes the pool"""
+        with _shared_lock:
+            self._refs -= 1
+            if self._refs > 0:
+                return
+            if _shared.get(self.connection_string) is self:
+                del _shared[self.connection_string]
+
+        self.close()
+
+    def _expired(self, created_at: float, returned_at: float, now: float) -> bool:
+        """Whether an idle connection should be recycled"""
+        if self.max_lifetime and now - created_at > self.max_lifetime:
+            return True
+        return self._size > self.min_size and now - returned_at > self.max_idle
+
+    def _healthy(self, conn: Any, returned_at: float, now: float) -> bool:
+        """Cheap closed check, plus a round trip for connections idle a while"""
+        if conn.closed:
+            return False
+
+        if now - returned_at < self.health_check_interval:
+            return True
+
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception as e:
+            logger.debug(f"Discarding unhealthy connection: {e}")
+            return False
+
+    def _discard(self, conn: Any):
+        self._created.pop(id(conn), None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _sweep(self, now: float):
+        """Recycle every expired idle connection, the caller holds the lock
+
+        Checkouts only take the most recently returned connection, so without
+        this the older ones at the left end would never be looked at.
+        """
+        for _ in range(len(self._idle)):
+            conn, created_at, returned_at = self._idle.popleft()
+            if self._expired(created_at, returned_at, now):
+                self._size -= 1
+                self._discard(conn)
+            else:
+                self._idle.append((conn, created_at, returned_at))
+
+    def getconn(self, timeout: Optional[float] = None) -> Any:
+        """Check out a connection, waiting up to timeout when the pool is exhausted"""
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise PoolTimeoutError("Connection pool is closed")
+
+                candidate = None
+                self._sweep(time.monotonic())
+
+                if self._idle:
+                    conn, _, returned_at = self._idle.pop()
+                    candidate = (conn, returned_at)
+
+                if candidate is None:
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._cond.wait(remaining):
+                        raise PoolTimeoutError(
+                            f"No connection available within the pool limit of "
+                            f"{self.max_size}"
+                        )
+                    continue
+
+            # Health checks may hit the network, keep them outside the lock
+            conn, returned_at = candidate
+            if self._healthy(conn, returned_at, time.monotonic()):
+                return conn
+
+            with self._cond:
+                self._size -= 1
+                self._discard(conn)
+                self._cond.notify()
+
+        try:
+            conn = self._connect(self.connection_string)
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+        self._created[id(conn)] = time.monotonic()
+        return conn
+
+    def putconn(self, conn: Any, discard: bool = False):
+        """Return a connection, rolling back any transaction left open"""
+        if not discard and not conn.closed:
+            try:
+                status = conn.get_transaction_status()
+                if status == TRANSACTION_STATUS_UNKNOWN:
+                    discard = True
+                elif status != TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Exception:
+                discard = True
+
+        with self._cond:
+            if discard or conn.closed or self._closed:
+                self._size -= 1
+                self._discard(conn)
+            else:
+                now = time.monotonic()
+                self._idle.append((conn, self._created.get(id(conn), now), now))
+            self._sweep(time.monotonic())
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection, committing on success and rolling back on error"""
+        conn = self.getconn()
+        discard = False
+
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            try:
+                conn.rollback()
+            except Exception:
+                discard = True
+            raise
+        finally:
+            self.putconn(conn, discard=discard)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+            }
+
+    def close(self):
+        """Close idle connections, checked out ones are closed when returned"""
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _, _ = self._idle.pop()
+                self._size -= 1
+                self._discard(conn)
+            self._cond.notify_all()
@@ -1,15 +1,30 @@
+from cognition_core.memory.embedding_cache import EmbeddingCache, embedder_fingerprint
 from crewai.utilities import EmbeddingConfigurator
 from crewai.utilities.paths import db_storage_path
 from typing import Any, Dict, List, Optional
+from cognition_core.cache import TTLCache
 from chromadb.config import Settings
 from chromadb.api import ClientAPI
+import threading
 import chromadb
 import contextlib
 import logging
+import weakref
+import atexit
 import shutil
 import uuid
 import io
 
+# Storages with a write buffer, held weakly and flushed once at exit
+_buffered_storages: "weakref.WeakSet[ChromaRAGStorage]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_buffered_storages():
+    """Flush documents still buffered at interpreter exit"""
+    for storage in list(_buffered_storages):
+        storage.flush()
+
 
 @contextlib.contextmanager
 def suppress_logging(
@@ -36,20 +51,59 @@ class ChromaRAGStorage:
     app: ClientAPI | None = None
 
     def __init__(
-        self, host: str, port: int, collection_name: str, embedder_config=None
+        self,
+        host: str,
+        port: int,
+        collection_name: str,
+        embedder_config=None,
+        settings: Optional[Dict[str, Any]] = None,
+        client: Optional[ClientAPI] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
     ):
         self.host = host
         self.port = port
         self.collection_name = collection_name
         self.embedder_config = embedder_config
+        self.settings = settings or {}
+        self._client = client
+
+        # Embeddings are cached by embedder config plus text, for save and search
+        self.embedding_cache = embedding_cache
+        self._embedder_fingerprint = embedder_fingerprint(embedder_config)
+
+        # Search results are cached per write generation, save and reset bump it
+        self.search_cache = TTLCache.from_settings(
+            {"ttl": 30, "max_bytes": None, **(self.settings.get("search_cache") or {})}
+        )
+        self._generation = 0
+
+        # Write buffer: documents are embedded and added in batches
+        buffer = self.settings.get("write_buffer") or {}
+        self.buffered = buffer.get("enabled", False)
+        self.buffer_max_items = buffer.get("max_items", 32)
+        self.buffer_max_age = buffer.get("max_age", 2.0)
+        self._pending: List[tuple] = []
+        self._flush_timer: Optional[threading.Timer] = None
+        self._buffer_lock = threading.RLock()
+
         self._initialize_app()
 
+        if self.buffered:
+            _buffered_storages.add(self)
+
     def _set_embedder_config(self):
         configurator = EmbeddingConfigurator()
         self.embedder_config = configurator.configure_embedder(self.embedder_config)
 
     def _initialize_app(self):
         self._set_embedder_config()
+        if self._client is not None:
+            self.app = self._client
+            self.collection = self.app.get_or_create_collection(
+                name=self.collection_name, embedding_function=self.embedder_config
+            )
+            return
+
         print(f"Initializing ChromaDB client: HttpClient")
         try:
             chroma_client = chromadb.HttpClient(
@@ -68,11 +122,86 @@ class ChromaRAGStorage:
     def save(self, value: Any, metadata: Dict[str, Any]) -> None:
         if not hasattr(self, "app") or not hasattr(self, "collection"):
             self._initialize_app()
+
+        self._generation += 1
+
         try:
-            self._generate_embedding(value, metadata)
+            if self.buffered:
+                self._buffer(value, metadata)
+            else:
+                self._generate_embedding(value, metadata)
         except Exception as e:
             logging.error(f"Error during save to {self.collection_name}: {str(e)}")
 
+    def _buffer(self, text: str, metadata: Dict[str, Any]) -> None:
+        """Queue a document, flushing once the buffer is full"""
+        with self._buffer_lock:
+            if not self._pending:
+                self._schedule_flush()
+
+            self._pending.append((text, metadata or None, str(uuid.uuid4())))
+
+            if len(self._pending) >= self.buffer_max_items:
+                self.flush()
+
+    def _schedule_flush(self) -> None:
+        """Flush a partial buffer once its oldest document reaches max_age"""
+        if self.buffer_max_age is None:
+            return
+
+        self._flush_timer = threading.Timer(self.buffer_max_age, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Embed and add all buffered documents in one batch"""
+        with self._buffer_lock:
+            pending, self._pending = self._pending, []
+
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            if not pending:
+                return
+
+            texts, metadatas, ids = (list(column) for column in zip(*pending))
+
+            try:
+                self._add(texts, metadatas, ids)
+            except Exception as e:
+                logging.error(
+                    f"Error flushing {len(pending)} documents to "
+                    f"{self.collection_name}: {str(e)}"
+                )
+
+    def close(self) -> None:
+        """Flush buffered documents and leave the exit hook"""
+        self.flush()
+        _buffered_storages.discard(self)
+
+    def _embed(self, texts: List[str]) -> List[Any]:
+        """Embed a batch of texts with one call to the embedding function"""
+        if self.embedding_cache is None:
+            return list(self.embedder_config(texts))
+
+        return self.embedding_cache.embed(
+            texts, self.embedder_config, self._embedder_fingerprint
+        )
+
+    def _add(
+        self, texts: List[str], metadatas: List[Optional[dict]], ids: List[str]
+    ) -> None:
+        if not hasattr(self, "app") or not getattr(self, "collection", None):
+            self._initialize_app()
+
+        self.collection.add(
+            documents=texts,
+            metadatas=metadatas,
+            ids=ids,
+            embeddings=self._embed(texts),
+        )
+
     def search(
         self,
         query: str,
@@ -83,9 +212,31 @@ class ChromaRAGStorage:
         if not hasattr(self, "app"):
             self._initialize_app()
 
+        # Read your own writes: buffered documents must be searchable
+        if self._pending:
+            self.flush()
+
+        key = None
+        if self.search_cache is not None:
+            key = self.search_cache.make_key(
+                self.collection_name,
+                {
+                    "generation": self._generation,
+                    "query": query,
+                    "limit": limit,
+                    "filter": filter,
+                    "score_threshold": score_threshold,
+                },
+            )
+            cached = self.search_cache.get(key)
+            if cached is not None:
+                return list(cached)
+
         try:
             with suppress_logging():
-                response = self.collection.query(query_texts=query, n_results=limit)
+                response = self.collection.query(
+                    query_embeddings=self._embed([query]), n_results=limit
+                )
 
             results = []
             for i in range(len(response["ids"][0])):
@@ -98,7 +249,10 @@ class ChromaRAGStorage:
                 if result["score"] >= score_threshold:
                     results.append(result)
 
-            return results
+            if key is not None:
+                self.search_cache.set(key, results)
+
+            return list(results)
         except Exception as e:
             logging.error(f"Error during search in {self.collection_name}: {str(e)}")
             return []
@@ -107,13 +261,16 @@ class ChromaRAGStorage:
         if not hasattr(self, "app") or not hasattr(self, "collection"):
             self._initialize_app()
 
-        self.collection.add(
-            documents=[text],
-            metadatas=[metadata or {}],
-            ids=[str(uuid.uuid4())],
-        )
+        self._add([text], [metadata or None], [str(uuid.uuid4())])
 
     def reset(self) -> None:
+        with self._buffer_lock:
+            self._pending = []
+
+        self._generation += 1
+        if self.search_cache is not None:
+            self.search_cache.invalidate()
+
         try:
             if self.app:
                 self.app.reset()
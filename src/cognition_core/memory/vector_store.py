@@ -0,0 +1,241 @@
+from cognition_core.memory.embedding_cache import EmbeddingCache, embedder_fingerprint
+from typing import Any, Dict, List, Optional, Union
+from crewai.utilities import EmbeddingConfigurator
+from pathlib import Path
+import numpy as np
+import threading
+import logging
+import shutil
+import uuid
+import json
+
+INITIAL_CAPACITY = 1024
+
+
+class NumpyVectorStorage:
+    """
+    In-process vector storage for memory entries backed by a float32 matrix.
+
+    Rows are L2-normalized so a matrix-vector product gives cosine similarity.
+    Vectors and records are appended to files under `path` as they are saved,
+    and read back on start. With `mmap` the matrix itself is a memory-mapped
+    view of the vectors file instead of a copy in RAM.
+    """
+
+    VECTORS_FILE = "vectors.f32"
+    RECORDS_FILE = "records.jsonl"
+
+    def __init__(
+        self,
+        collection_name: str,
+        path: Union[str, Path],
+        embedder_config=None,
+        mmap: bool = False,
+        embedding_cache: Optional[EmbeddingCache] = None,
+    ):
+        self.collection_name = collection_name
+        self.path = Path(path)
+        self.mmap = mmap
+        self.embedding_cache = embedding_cache
+        self._embedder_fingerprint = embedder_fingerprint(embedder_config)
+        self.embedder_config = EmbeddingConfigurator().configure_embedder(
+            embedder_config
+        )
+        self._lock = threading.RLock()
+        self._matrix: Optional[np.ndarray] = None
+        self._records: List[Dict[str, Any]] = []
+        self._load()
+
+    @property
+    def count(self) -> int:
+        return len(self._records)
+
+    @property
+    def dimension(self) -> Optional[int]:
+        return None if self._matrix is None else self._matrix.shape[1]
+
+    def _load(self) -> None:
+        """Read persisted records and vectors, dropping a torn trailing write"""
+        self.path.mkdir(parents=True, exist_ok=True)
+        records_file = self.path / self.RECORDS_FILE
+        vectors_file = self.path / self.VECTORS_FILE
+
+        if records_file.exists():
+            with records_file.open() as f:
+                for line in f:
+                    try:
+                        self._records.append(json.loads(line))
+                    except ValueError:
+                        break
+
+        if not self._records or not vectors_file.exists():
+            self._records = []
+            return
+
+        dimension = self._records[0]["dim"]
+        stored_rows = vectors_file.stat().st_size // (4 * dimension)
+        del self._records[stored_rows:]
+
+        if self.mmap:
+            self._open_mmap(dimension, max(stored_rows, INITIAL_CAPACITY))
+        else:
+            self._matrix = np.empty(
+                (max(len(self._records), INITIAL_CAPACITY), dimension),
+                dtype=np.float32,
+            )
+            self._matrix[: self.count] = np.fromfile(
+                vectors_file, dtype=np.float32, count=self.count * dimension
+            ).reshape(-1, dimension)
+
+    def _open_mmap(self, dimension: int, capacity: int) -> None:
+        vectors_file = self.path / self.VECTORS_FILE
+        size = capacity * dimension * 4
+
+        with open(vectors_file, "ab") as f:
+            if f.tell() < size:
+                f.truncate(size)
+
+        self._matrix = np.memmap(
+            vectors_file, dtype=np.float32, mode="r+", shape=(capacity, dimension)
+        )
+
+    def _ensure_capacity(self, rows: int, dimension: int) -> None:
+        """Grow the matrix geometrically so appends stay amortized O(1)"""
+        if self._matrix is not None and self._matrix.shape[0] >= rows:
+            return
+
+        capacity = INITIAL_CAPACITY
+        if self._matrix is not None:
+            capacity = self._matrix.shape[0]
+        while capacity < rows:
+            capacity *= 2
+
+        if self.mmap:
+            if self._matrix is not None:
+                self._matrix.flush()
+            self._matrix = None
+            self._open_mmap(dimension, capacity)
+            return
+
+        matrix = np.empty((capacity, dimension), dtype=np.float32)
+        if self._matrix is not None:
+            matrix[: self.count] = self._matrix[: self.count]
+        self._matrix = matrix
+
+    def _write_row(self, row: int, vector: np.ndarray) -> None:
+        """Write a row at its offset and cut the file after it
+
+        A file last opened with mmap is zero-padded to its capacity, so rows
+        must not simply be appended.
+        """
+        vectors_file = self.path / self.VECTORS_FILE
+
+        with open(vectors_file, "r+b" if vectors_file.exists() else "wb") as f:
+            f.seek(row * vector.nbytes)
+            f.write(vector.tobytes())
+            f.truncate()
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        if self.embedding_cache is None:
+            vectors = self.embedder_config(texts)
+        else:
+            vectors = self.embedding_cache.embed(
+                texts, self.embedder_config, self._embedder_fingerprint
+            )
+
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(len(texts), -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1, norms)
+
+    def save(self, value: Any, metadata: Dict[str, Any]) -> None:
+        try:
+            vector = self._embed([str(value)])[0]
+            record = {
+                "id": str(uuid.uuid4()),
+                "context": str(value),
+                "metadata": metadata or {},
+                "dim": int(vector.shape[0]),
+            }
+
+            with self._lock:
+                if self.dimension not in (None, vector.shape[0]):
+                    raise ValueError(
+                        f"Embedding dimension {vector.shape[0]} does not match "
+                        f"{self.dimension} of {self.collection_name}"
+                    )
+
+                self._ensure_capacity(self.count + 1, vector.shape[0])
+                self._matrix[self.count] = vector
+
+                # Vector first: a record without its vector is dropped on load
+                if not self.mmap:
+                    self._write_row(self.count, vector)
+
+                with open(self.path / self.RECORDS_FILE, "a") as f:
+                    f.write(json.dumps(record, default=str) + "\n")
+
+                self._records.append(record)
+        except Exception as e:
+            logging.error(f"Error during save to {self.collection_name}: {str(e)}")
+
+    def search(
+        self,
+        query: str,
+        limit: int = 3,
+        filter: Optional[dict] = None,
+        score_threshold: float = 0.35,
+    ) -> List[Any]:
+        """Cosine top-k, keeping results with similarity >= score_threshold"""
+        try:
+            with self._lock:
+                count = self.count
+                if not count:
+                    return []
+                matrix = self._matrix[:count]
+                records = self._records[:count]
+
+            scores = matrix @ self._embed([query])[0]
+
+            if filter:
+                mask = np.array(
+                    [
+                        all(r["metadata"].get(k) == v for k, v in filter.items())
+                        for r in records
+                    ]
+                )
+                scores = np.where(mask, scores, -np.inf)
+
+            k = min(limit, count)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+
+            return [
+                {
+                    "id": records[i]["id"],
+                    "metadata": records[i]["metadata"],
+                    "context": records[i]["context"],
+                    "score": float(scores[i]),
+                }
+                for i in top
+                if scores[i] >= score_threshold
+            ]
+        except Exception as e:
+            logging.error(f"Error during search in {self.collection_name}: {str(e)}")
+            return []
+
+    def flush(self) -> None:
+        """Push memory-mapped rows to disk, appends are otherwise already durable"""
+        with self._lock:
+            if isinstance(self._matrix, np.memmap):
+                self._matrix.flush()
+
+    def close(self) -> None:
+        """Flush pending memory-mapped rows, the store stays usable afterwards"""
+        self.flush()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._matrix = None
+            self._records = []
+            shutil.rmtree(self.path, ignore_errors=True)
+            self.path.mkdir(parents=True, exist_ok=True)
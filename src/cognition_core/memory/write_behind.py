@@ -0,0 +1,155 @@
+from typing import Any, Callable, Dict, List, Optional
+from cognition_core.logger import logger
+import threading
+import weakref
+import atexit
+import queue
+import time
+
+logger = logger.getChild(__name__)
+
+_FLUSH = object()
+_STOP = object()
+
+# Held weakly so closed buffers, and what they write to, can be collected
+_open_buffers: "weakref.WeakSet[WriteBehindBuffer]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_buffers():
+    """Flush every buffer still open at interpreter exit"""
+    for buffer in list(_open_buffers):
+        buffer.close()
+
+
+class WriteBehindBuffer:
+    """Bounded queue drained in batches by a background flusher thread
+
+    `put` only blocks when the queue is full, which pushes back on producers
+    that outrun the database. Pending rows are flushed on `close` and at exit.
+    The flusher thread runs until `close`, so owners should close buffers they
+    stop using.
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[List[Any]], None],
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue: int = 10000,
+        max_retries: int = 3,
+        retry_delay: float = 0.5,
+        name: str = "write-behind",
+    ):
+        self.write_batch = write_batch
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.written = 0
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        _open_buffers.add(self)
+
+    @classmethod
+    def from_settings(
+        cls, write_batch: Callable[[List[Any]], None], settings: Dict[str, Any]
+    ) -> Optional["WriteBehindBuffer"]:
+        """Build a buffer from a `write_behind` block, None if disabled"""
+        if not settings or not settings.get("enabled", False):
+            return None
+
+        return cls(
+            write_batch,
+            batch_size=settings.get("batch_size", 100),
+            flush_interval=settings.get("flush_interval", 1.0),
+            max_queue=settings.get("max_queue", 10000),
+            max_retries=settings.get("max_retries", 3),
+        )
+
+    def put(self, item: Any, timeout: Optional[float] = None):
+        """Enqueue an item, blocking while the queue is full"""
+        if self._closed:
+            raise RuntimeError("Write-behind buffer is closed")
+        self._queue.put(item, timeout=timeout)
+
+    def flush(self):
+        """Block until everything enqueued so far has been written"""
+        if self._closed or not self._thread.is_alive():
+            return
+        self._queue.put(_FLUSH)
+        self._queue.join()
+
+    def close(self):
+        """Write pending items and stop the flusher"""
+        if self._closed:
+            return
+
+        self._closed = True
+        _open_buffers.discard(self)
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _run(self):
+        stopping = False
+
+        while not stopping:
+            first = self._queue.get()
+            batch, markers = [], [first]
+
+            if first is _STOP:
+                stopping = True
+            elif first is not _FLUSH:
+                batch.append(first)
+                markers = []
+                deadline = time.monotonic() + self.flush_interval
+
+                # Gather until the batch is full, the interval ends or a marker
+                while len(batch) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    try:
+                        item = self._queue.get(timeout=max(remaining, 0))
+                    except queue.Empty:
+                        break
+
+                    if item is _FLUSH or item is _STOP:
+                        markers.append(item)
+                        stopping = item is _STOP
+                        break
+
+                    batch.append(item)
+
+            if stopping:
+                # Drain whatever is left so shutdown is durable
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _FLUSH or item is _STOP:
+                        markers.append(item)
+                    else:
+                        batch.append(item)
+
+            for start in range(0, len(batch), self.batch_size):
+                self._write(batch[start : start + self.batch_size])
+
+            for _ in range(len(batch) + len(markers)):
+                self._queue.task_done()
+
+    def _write(self, batch: List[Any]):
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.write_batch(batch)
+                self.written += len(batch)
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self.dropped += len(batch)
+                    logger.error(f"Dropping {len(batch)} buffered writes: {e}")
+                    return
+                logger.warning(f"Buffered write failed, retrying: {e}")
+                time.sleep(self.retry_delay * (2**attempt))
@@ -0,0 +1,5 @@
+from cognition_core.cache import TTLCache
+
+
+class ToolResultCache(TTLCache):
+    """Thread-safe TTL/LRU cache for tool results, keyed on tool name and arguments"""
@@ -0,0 +1,138 @@
+from typing import Any, Deque, Dict, Optional
+from collections import deque
+import asyncio
+import time
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker for a single tool service"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> "CircuitBreaker":
+        return cls(
+            failure_threshold=settings.get("failure_threshold", 5),
+            reset_timeout=settings.get("reset_timeout", 30.0),
+            half_open_max_calls=settings.get("half_open_max_calls", 1),
+        )
+
+    def allow(self) -> bool:
+        """Whether a call may be attempted right now"""
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self._half_open_calls = 0
+
+        if self.state == self.HALF_OPEN:
+            if self._half_open_calls >= self.half_open_max_calls:
+                return False
+            self._half_open_calls += 1
+
+        return True
+
+    def release(self):
+        """Give back the half-open slot of a call that ended without an outcome"""
+        if self.state == self.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter driven by observed failures and latency"""
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff: float = 0.5,
+        latency_threshold: Optional[float] = None,
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_threshold = latency_threshold
+        self.inflight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> "AdaptiveLimiter":
+        return cls(
+            initial_limit=settings.get("initial_limit", 10),
+            min_limit=settings.get("min_limit", 1),
+            max_limit=settings.get("max_limit", 100),
+            backoff=settings.get("backoff", 0.5),
+            latency_threshold=settings.get("latency_threshold"),
+        )
+
+    async def acquire(self):
+        while self.inflight >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass the wake-up on if we were woken and cancelled at once
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()
+                raise
+
+        self.inflight += 1
+
+    def release(self):
+        self.inflight -= 1
+        self._wake()
+
+    def _wake(self):
+        free = int(self.limit) - self.inflight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def record(self, latency: float, failed: bool = False):
+        """Additive increase on healthy calls, multiplicative decrease otherwise"""
+        if failed or (
+            self.latency_threshold is not None and latency > self.latency_threshold
+        ):
+            self.limit = max(self.min_limit, self.limit * self.backoff)
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._wake()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
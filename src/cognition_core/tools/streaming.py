@@ -0,0 +1,130 @@
+from typing import Any, AsyncIterator, Optional
+from pathlib import Path
+import tempfile
+import httpx
+import json
+
+NDJSON_CONTENT_TYPES = (
+    "application/x-ndjson",
+    "application/ndjson",
+    "application/jsonl",
+)
+OVERFLOW_POLICIES = ("truncate", "spill", "error")
+SPILL_PREVIEW_BYTES = 2048
+MAX_SPILL_FILES = 100
+
+
+class ResultTooLargeError(Exception):
+    pass
+
+
+def is_ndjson(response: httpx.Response) -> bool:
+    content_type = response.headers.get("content-type", "").split(";")[0].strip()
+    return content_type in NDJSON_CONTENT_TYPES
+
+
+def _decode(data: bytes, ndjson: bool) -> Any:
+    """Parse a complete body as NDJSON records, JSON or fall back to text"""
+    text = data.decode("utf-8", errors="replace")
+
+    if ndjson:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+async def iter_response(response: httpx.Response) -> AsyncIterator[Any]:
+    """Yield NDJSON records one by one, or raw byte chunks for other bodies"""
+    if is_ndjson(response):
+        async for line in response.aiter_lines():
+            if line.strip():
+                yield json.loads(line)
+    else:
+        async for chunk in response.aiter_bytes():
+            yield chunk
+
+
+def prune_spills(spill_dir: Path, keep: int):
+    """Delete all but the newest `keep` spill files in spill_dir"""
+    try:
+        spills = sorted(
+            Path(spill_dir).glob("*.out"), key=lambda path: path.stat().st_mtime
+        )
+        for path in spills[: max(len(spills) - keep, 0)]:
+            path.unlink(missing_ok=True)
+    except OSError:
+        # Another reader pruning the same directory, its pass covers ours
+        pass
+
+
+async def read_response(
+    response: httpx.Response,
+    max_bytes: Optional[int] = None,
+    overflow: str = "truncate",
+    spill_dir: Optional[Path] = None,
+    name: str = "tool",
+    max_spill_files: Optional[int] = MAX_SPILL_FILES,
+) -> Any:
+    """Read a streamed body without holding more than max_bytes in memory
+
+    Spilled results are kept until max_spill_files newer spills exist in the
+    same directory, callers that need them longer must move them away.
+    """
+    buffer = bytearray()
+    spill = None
+    total = 0
+
+    try:
+        async for chunk in response.aiter_bytes():
+            total += len(chunk)
+
+            if spill is not None:
+                spill.write(chunk)
+                continue
+
+            if max_bytes and len(buffer) + len(chunk) > max_bytes:
+                if overflow == "error":
+                    raise ResultTooLargeError(
+                        f"Result of {name} exceeds {max_bytes} bytes"
+                    )
+
+                if overflow == "spill":
+                    spill_dir = Path(spill_dir or tempfile.gettempdir())
+                    spill_dir.mkdir(parents=True, exist_ok=True)
+                    spill = tempfile.NamedTemporaryFile(
+                        dir=spill_dir, prefix=f"{name}-", suffix=".out", delete=False
+                    )
+                    spill.write(buffer)
+                    spill.write(chunk)
+                    continue
+
+                # Truncate: keep what fits and stop reading from the server
+                buffer.extend(chunk[: max_bytes - len(buffer)])
+                text = buffer.decode("utf-8", errors="replace")
+                return f"{text}\n...[truncated after {max_bytes} bytes]"
+
+            buffer.extend(chunk)
+    except BaseException:
+        # A partially written spill is of no use to anyone
+        if spill is not None:
+            spill.close()
+            Path(spill.name).unlink(missing_ok=True)
+        raise
+    finally:
+        if spill is not None:
+            spill.close()
+
+    if spill is not None:
+        if max_spill_files:
+            prune_spills(Path(spill.name).parent, max_spill_files)
+
+        return {
+            "spilled_to": spill.name,
+            "bytes": total,
+            "preview": buffer[:SPILL_PREVIEW_BYTES].decode("utf-8", errors="replace"),
+        }
+
+    return _decode(bytes(buffer), is_ndjson(response))
@@ -1,14 +1,46 @@
 from crewai.tools.structured_tool import CrewStructuredTool
 from crewai.agents.tools_handler import ToolsHandler
-from typing import Dict, List, Optional, Any, Type
-from cognition_core.config import config_manager
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Any, Tuple, Type
+from cognition_core.tools.resilience import AdaptiveLimiter, CircuitBreaker
+from cognition_core.tools.streaming import ResultTooLargeError, read_response
+from cognition_core.tools.streaming import OVERFLOW_POLICIES, iter_response
+from cognition_core.tools.streaming import MAX_SPILL_FILES
+from cognition_core.tools.cache import ToolResultCache
+from cognition_core.config import ConfigChange, get_config_manager
 from cognition_core.logger import logger
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from pathlib import Path
+import importlib.util
+import threading
+import hashlib
 import asyncio
 import httpx
+import json
+import time
+import os
 
 logger = logger.getChild(__name__)
 
+_MISSING = object()
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+class ToolExecutionError(Exception):
+    pass
+
+
+class ToolServiceUnavailableError(ToolExecutionError):
+    pass
+
+
+class CallOutcome:
+    """Verdict of a guarded call, None until the caller has seen the response"""
+
+    def __init__(self):
+        self.failed: Optional[bool] = None
+
 
 class CognitionToolsHandler(ToolsHandler):
     """Enhanced tools handler that integrates with ToolService"""
@@ -39,6 +71,15 @@ class ToolDefinition(BaseModel):
         default_factory=dict, description="Parameter definitions"
     )
     cache_enabled: bool = Field(default=False, description="Whether caching is enabled")
+    timeout: Optional[float] = Field(
+        default=None, description="Per-tool request timeout in seconds"
+    )
+    coalesce: bool = Field(
+        default=False, description="Whether identical in-flight calls are coalesced"
+    )
+    service: Optional[str] = Field(
+        default=None, description="Name of the tool service exposing the tool"
+    )
 
 
 class ToolServiceConfig(BaseModel):
@@ -48,38 +89,228 @@ class ToolServiceConfig(BaseModel):
     enabled: bool
     base_url: str
     endpoints: List[Dict[str, str]]
+    coalesce: bool = False
+
+
+class ToolCallResult(BaseModel):
+    """Outcome of a single call in a batch"""
+
+    tool: str
+    result: Any = None
+    error: Optional[str] = None
+
+
+class ToolRegistry:
+    """Immutable, versioned snapshot of the loaded tools"""
+
+    __slots__ = ("tools", "definitions", "version")
+
+    def __init__(
+        self,
+        tools: Dict[str, CrewStructuredTool],
+        version: int = 0,
+        definitions: Optional[Dict[str, "ToolDefinition"]] = None,
+    ):
+        self.tools = MappingProxyType(dict(tools))
+        self.definitions = MappingProxyType(dict(definitions or {}))
+        self.version = version
+
+    def get(self, name: str) -> Optional[CrewStructuredTool]:
+        return self.tools.get(name)
+
+    def names(self) -> List[str]:
+        return list(self.tools)
 
 
 class ToolService:
+    _shared: Optional["ToolService"] = None
+    _shared_lock = threading.Lock()
+
     def __init__(self):
-        self.config_manager = config_manager
-        self.tools: Dict[str, CrewStructuredTool] = {}
+        self.config_manager = get_config_manager()
+        self._registry = ToolRegistry({})
         self._http_clients: Dict[str, httpx.AsyncClient] = {}
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        self._etags: Dict[Tuple[str, str], str] = {}
+        self._discovered: Dict[Tuple[str, str], List[ToolDefinition]] = {}
+        self._definition_hashes: Dict[str, str] = {}
+        self._param_models: Dict[str, Type[BaseModel]] = {}
         self._refresh_lock = asyncio.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._refresh_task = None
+        self._loop_lock = threading.Lock()
+        self._started = False
+        self._unsubscribe = None
+        self.settings: Dict[str, Any] = {}
+        self.cache: Optional[ToolResultCache] = None
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
         self._load_config()
 
+    @classmethod
+    def shared(cls) -> "ToolService":
+        """Return the process-wide tool service, starting it on first use"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                service = cls()
+                service.start()
+                cls._shared = service
+            return cls._shared
+
     def _load_config(self):
         """Load tool configuration from config manager"""
         try:
-            self.config = self.config_manager.get_config("tools")
-            self.settings = self.config.get("settings", {})
-
-            self.tool_services = [
-                ToolServiceConfig(**service)
-                for service in self.config.get("tool_services", [])
-                if service.get("enabled", False)
-            ]
-            logger.debug(f"Tool services: {self.tool_services}")
+            self._apply_config(self.config_manager.get_config("tools"))
         except Exception as e:
             logger.error(f"Failed to load tool configuration: {e}")
             raise
 
+    def _apply_config(self, config: Dict[str, Any]):
+        """Apply a tools config, keeping cache and per-service state that is unchanged"""
+        previous = self.settings
+        settings = config.get("settings", {})
+
+        def unchanged(key: str) -> bool:
+            return previous.get(key, {}) == settings.get(key, {})
+
+        self.config = config
+        self.settings = settings
+
+        if self.cache is None or not unchanged("cache"):
+            self.cache = ToolResultCache.from_settings(settings.get("cache", {}))
+
+        self.tool_services = [
+            ToolServiceConfig(**service)
+            for service in config.get("tool_services", [])
+            if service.get("enabled", False)
+        ]
+        logger.debug(f"Tool services: {self.tool_services}")
+
+        breakers = self._breakers if unchanged("circuit_breaker") else {}
+        limiters = self._limiters if unchanged("concurrency") else {}
+
+        self._breakers = {
+            service.name: breakers.get(service.name)
+            or CircuitBreaker.from_settings(settings.get("circuit_breaker", {}))
+            for service in self.tool_services
+        }
+        self._limiters = {
+            service.name: limiters.get(service.name)
+            or AdaptiveLimiter.from_settings(settings.get("concurrency", {}))
+            for service in self.tool_services
+        }
+
+    def _on_config_change(self, change: ConfigChange):
+        """Apply a reloaded tools config and reconcile clients and tools"""
+        if change.new is None:
+            logger.warning("Tools configuration removed, keeping current tools")
+            return
+
+        previous_settings = self.settings
+        previous_services = {service.name: service for service in self.tool_services}
+        self._apply_config(change.new)
+
+        # Clients are rebuilt when their pool settings or their service changed
+        rebuild_all = any(
+            previous_settings.get(key) != self.settings.get(key)
+            for key in ("http", "validation")
+        )
+        current_services = {service.name: service for service in self.tool_services}
+        stale = [
+            name
+            for name, service in previous_services.items()
+            if rebuild_all or current_services.get(name) != service
+        ]
+        removed = [name for name in previous_services if name not in current_services]
+
+        if self._loop is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self._reconcile(stale, removed), self._loop)
+
+        if previous_settings.get("refresh") != self.settings.get("refresh"):
+            if self._refresh_task is not None:
+                self._refresh_task.cancel()
+                self._refresh_task = None
+            self._schedule_refresh()
+
+    async def _reconcile(self, stale: List[str], removed: List[str]):
+        """Replace clients of changed services, drop removed ones and refresh
+
+        Holds the refresh lock throughout so an in-flight refresh cannot put
+        back tools of a service that has just been removed.
+        """
+        async with self._refresh_lock:
+            for name in stale:
+                client = self._http_clients.pop(name, None)
+                if client is not None:
+                    await client.aclose()
+
+            for key in [key for key in self._discovered if key[0] in removed]:
+                self._discovered.pop(key, None)
+                self._etags.pop(key, None)
+
+            if removed:
+                current = self._registry
+                kept = [
+                    name
+                    for name, tool_def in current.definitions.items()
+                    if tool_def.service not in removed
+                ]
+                for name in current.definitions:
+                    if name not in kept:
+                        self._definition_hashes.pop(name, None)
+
+                self._registry = ToolRegistry(
+                    {name: current.tools[name] for name in kept},
+                    current.version + 1,
+                    {name: current.definitions[name] for name in kept},
+                )
+
+            await self._init_clients()
+            try:
+                await self._refresh()
+            except Exception:
+                # Already logged by _refresh, keep serving the last registry
+                pass
+
+    def _get_limits(self) -> httpx.Limits:
+        """Build connection pool limits from the http settings"""
+        http_settings = self.settings.get("http", {})
+        return httpx.Limits(
+            max_connections=http_settings.get("max_connections", 100),
+            max_keepalive_connections=http_settings.get(
+                "max_keepalive_connections", 20
+            ),
+            keepalive_expiry=http_settings.get("keepalive_expiry", 30.0),
+        )
+
+    def _http2_enabled(self) -> bool:
+        """Check whether HTTP/2 is requested and the h2 package is available"""
+        if not self.settings.get("http", {}).get("http2", False):
+            return False
+
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+            return False
+
+        return True
+
     async def _init_clients(self):
-        """Initialize HTTP clients for each service"""
+        """Initialize pooled HTTP clients for each service"""
+        limits = self._get_limits()
+        http2 = self._http2_enabled()
+
         for service in self.tool_services:
+            if service.name in self._http_clients:
+                continue
+
             self._http_clients[service.name] = httpx.AsyncClient(
                 base_url=service.base_url,
                 timeout=self.settings.get("validation", {}).get("response_timeout", 30),
+                limits=limits,
+                http2=http2,
             )
 
     def _get_python_type(self, type_str: str) -> Type:
@@ -95,118 +326,814 @@ class ToolService:
         return type_mapping.get(type_str.lower(), str)
 
     async def fetch_tool_definitions(self) -> List[ToolDefinition]:
-        """Fetch tool definitions from all configured services"""
-        all_tools = []
+        """Fetch tool definitions from all configured services concurrently"""
+        discovery = self.settings.get("discovery", {})
+        semaphore = asyncio.Semaphore(discovery.get("max_concurrency", 10))
+        deadline = discovery.get(
+            "service_timeout",
+            self.settings.get("validation", {}).get("response_timeout", 30),
+        )
 
-        for service in self.tool_services:
-            client = self._http_clients[service.name]
-            logger.debug(f"Fetching tools from {service.name} at {service.base_url}")
+        async def fetch(service: ToolServiceConfig) -> List[ToolDefinition]:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self._fetch_service_tools(service), timeout=deadline
+                    )
+                except asyncio.TimeoutError:
+                    logger.error(
+                        f"Tool discovery for {service.name} exceeded {deadline}s deadline"
+                    )
+                    return []
+                except Exception as e:
+                    # One broken service must not fail discovery for the others
+                    logger.error(f"Tool discovery for {service.name} failed: {e}")
+                    return []
 
-            for endpoint in service.endpoints:
-                if endpoint["method"] == "GET" and "/tools" in endpoint["path"]:
-                    try:
-                        response = await client.get(endpoint["path"])
-                        response.raise_for_status()
-
-                        response_data = response.json()
-                        tools_data = response_data.get("tools", [])
-
-                        for tool_data in tools_data:
-                            try:
-                                tool = ToolDefinition(**tool_data)
-                                all_tools.append(tool)
-                            except Exception as e:
-                                logger.error(
-                                    f"Failed to parse tool data: {tool_data}. Error: {e}"
-                                )
-                                continue
-
-                    except Exception as e:
-                        logger.error(
-                            f"Error fetching tools from {service.name}: {str(e)}"
-                        )
-                        logger.debug(
-                            "Full error details:", exc_info=False
-                        )  # todo: change to True
+        results = await asyncio.gather(
+            *(fetch(service) for service in self.tool_services)
+        )
+
+        # Partial results: a failing service only drops its own tools
+        return [tool for service_tools in results for tool in service_tools]
+
+    async def _fetch_service_tools(
+        self, service: ToolServiceConfig
+    ) -> List[ToolDefinition]:
+        """Fetch tool definitions from a single service"""
+        service_tools = []
+        client = self._http_clients[service.name]
+        logger.debug(f"Fetching tools from {service.name} at {service.base_url}")
+
+        for endpoint in service.endpoints:
+            if endpoint["method"] == "GET" and "/tools" in endpoint["path"]:
+                discovery_key = (service.name, endpoint["path"])
+                headers = {}
+
+                # Conditional request, unchanged listings come back as 304
+                if discovery_key in self._discovered and discovery_key in self._etags:
+                    headers["If-None-Match"] = self._etags[discovery_key]
+
+                try:
+                    response = await client.get(endpoint["path"], headers=headers)
+
+                    if response.status_code == 304:
+                        logger.debug(f"Tools of {service.name} not modified")
+                        service_tools.extend(self._discovered[discovery_key])
                         continue
 
-        return all_tools
+                    response.raise_for_status()
+
+                    response_data = response.json()
+                    tools_data = response_data.get("tools", [])
+                    endpoint_tools = []
+
+                    for tool_data in tools_data:
+                        try:
+                            tool = ToolDefinition(
+                                **{**tool_data, "service": service.name}
+                            )
+                            endpoint_tools.append(tool)
+                        except Exception as e:
+                            logger.error(
+                                f"Failed to parse tool data: {tool_data}. Error: {e}"
+                            )
+                            continue
+
+                    service_tools.extend(endpoint_tools)
+                    self._discovered[discovery_key] = endpoint_tools
+
+                    if response.headers.get("ETag"):
+                        self._etags[discovery_key] = response.headers["ETag"]
+
+                except Exception as e:
+                    logger.error(f"Error fetching tools from {service.name}: {str(e)}")
+                    logger.debug(
+                        "Full error details:", exc_info=False
+                    )  # todo: change to True
+                    continue
+
+        return service_tools
 
     async def load_tools(self):
-        """Fetch and load all tools into memory"""
+        """Fetch tools, rebuild changed ones and publish a new registry snapshot"""
         tool_definitions = await self.fetch_tool_definitions()
 
+        if self._apply_definitions(tool_definitions):
+            self._save_snapshot()
+
+    def _apply_definitions(self, tool_definitions: List[ToolDefinition]) -> bool:
+        """Rebuild changed tools and swap in a new registry, True if anything changed
+
+        Tools no endpoint lists any more are dropped. An endpoint that failed
+        keeps its last listing in _discovered, so its tools are kept.
+        """
+        current = self._registry
+        tools = dict(current.tools)
+        definitions = dict(current.definitions)
+        changed = {}
+
+        listed = {
+            tool_def.name
+            for endpoint_tools in self._discovered.values()
+            for tool_def in endpoint_tools
+        }
+        discovered_services = {service for service, _ in self._discovered}
+        removed = [
+            name
+            for name, tool_def in current.definitions.items()
+            if tool_def.service in discovered_services and name not in listed
+        ]
+        for name in removed:
+            tools.pop(name, None)
+            definitions.pop(name, None)
+
         for tool_def in tool_definitions:
-            logger.debug(f"Processing tool: {tool_def.name}")
-
-            # Create field definitions for parameters
-            fields = {}
-            for name, param in tool_def.parameters.items():
-                python_type = self._get_python_type(param.type)
-                fields[name] = (python_type, Field(..., description=param.description))
-
-            # Create the parameter schema class
-            param_schema = type(
-                f"{tool_def.name}Params",
-                (BaseModel,),
-                {
-                    "__annotations__": {k: v[0] for k, v in fields.items()},
-                    **{k: v[1] for k, v in fields.items()},
-                },
-            )
+            digest = self._hash(tool_def.model_dump(mode="json"))
+
+            if (
+                self._definition_hashes.get(tool_def.name) == digest
+                and tool_def.name in tools
+            ):
+                continue
+
+            tools[tool_def.name] = self._build_tool(tool_def)
+            definitions[tool_def.name] = tool_def
+            changed[tool_def.name] = digest
+
+        logger.debug(
+            f"Rebuilt {len(changed)} of {len(tool_definitions)} tools, "
+            f"removed {len(removed)}"
+        )
+
+        if not changed and not removed:
+            return False
+
+        # Copy-on-write: readers keep using the previous snapshot until this swap
+        self._registry = ToolRegistry(tools, current.version + 1, definitions)
+        self._definition_hashes.update(changed)
+        for name in removed:
+            self._definition_hashes.pop(name, None)
+
+        # Results produced by a previous definition may no longer be valid
+        if self.cache is not None:
+            for name in [*changed, *removed]:
+                self.cache.invalidate(name)
 
-            # Create the tool
-            tool = CrewStructuredTool.from_function(
-                name=tool_def.name,
-                description=tool_def.description,
-                args_schema=param_schema,
-                func=self._create_tool_executor(tool_def),
+        return True
+
+    def _snapshot_path(self) -> Optional[Path]:
+        """Location of the warm-start snapshot, None when disabled"""
+        snapshot = self.settings.get("snapshot", {})
+
+        if not snapshot.get("enabled", True):
+            return None
+
+        return Path(
+            snapshot.get("path")
+            or Path(self.config_manager.storage_dir) / "tool_snapshot.json"
+        )
+
+    def _save_snapshot(self):
+        """Persist discovered definitions and their ETags for the next start"""
+        path = self._snapshot_path()
+        if path is None:
+            return
+
+        entries = [
+            {
+                "service": service,
+                "path": endpoint,
+                "etag": self._etags.get((service, endpoint)),
+                "tools": [
+                    tool_def.model_dump(mode="json")
+                    for tool_def in self._discovered[(service, endpoint)]
+                ],
+            }
+            for service, endpoint in self._discovered
+        ]
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps({"version": SNAPSHOT_FORMAT_VERSION, "entries": entries})
             )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write tool snapshot {path}: {e}")
 
-            self.tools[tool_def.name] = tool
+    def _load_snapshot(self) -> bool:
+        """Publish tools from the warm-start snapshot, True if any were loaded"""
+        path = self._snapshot_path()
+        if path is None or not path.exists():
+            return False
 
-        # Print tool details
-        for name, tool in self.tools.items():
-            logger.debug(f"Tool: {name}")
-            logger.debug(f"Description: {tool.description}")
-            logger.debug(f"Parameters: {tool.args_schema.model_json_schema()}")
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") != SNAPSHOT_FORMAT_VERSION:
+                return False
+
+            services = {service.name for service in self.tool_services}
+            tool_definitions = []
+
+            for entry in data.get("entries", []):
+                if entry["service"] not in services:
+                    continue
+
+                key = (entry["service"], entry["path"])
+                endpoint_tools = [ToolDefinition(**tool) for tool in entry["tools"]]
+                self._discovered[key] = endpoint_tools
+                if entry.get("etag"):
+                    self._etags[key] = entry["etag"]
+
+                tool_definitions.extend(endpoint_tools)
+
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable tool snapshot {path}: {e}")
+            self._discovered.clear()
+            self._etags.clear()
+            return False
+
+        self._apply_definitions(tool_definitions)
+        logger.debug(f"Warm-started {len(tool_definitions)} tools from {path}")
+        return bool(tool_definitions)
+
+    @staticmethod
+    def _hash(data: Any) -> str:
+        """Content hash of JSON-serializable data"""
+        return hashlib.sha256(
+            json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+        ).hexdigest()
+
+    def _get_param_model(self, tool_def: ToolDefinition) -> Type[BaseModel]:
+        """Return the parameter model, reusing models for identical parameter sets"""
+        params_hash = self._hash(
+            {k: v.model_dump() for k, v in tool_def.parameters.items()}
+        )
+        param_schema = self._param_models.get(params_hash)
+
+        if param_schema is not None:
+            return param_schema
+
+        # Create field definitions for parameters
+        fields = {}
+        for name, param in tool_def.parameters.items():
+            python_type = self._get_python_type(param.type)
+            fields[name] = (python_type, Field(..., description=param.description))
+
+        # Create the parameter schema class
+        param_schema = type(
+            f"{tool_def.name}Params",
+            (BaseModel,),
+            {
+                "__annotations__": {k: v[0] for k, v in fields.items()},
+                **{k: v[1] for k, v in fields.items()},
+            },
+        )
+
+        self._param_models[params_hash] = param_schema
+        return param_schema
+
+    def _build_tool(self, tool_def: ToolDefinition) -> CrewStructuredTool:
+        """Create the structured tool for a definition"""
+        logger.debug(f"Processing tool: {tool_def.name}")
+
+        tool = CrewStructuredTool.from_function(
+            name=tool_def.name,
+            description=tool_def.description,
+            args_schema=self._get_param_model(tool_def),
+            func=self._create_tool_executor(tool_def),
+        )
+
+        logger.debug(f"Tool: {tool.name}")
+        logger.debug(f"Description: {tool.description}")
+        logger.debug(f"Parameters: {tool.args_schema.model_json_schema()}")
+        return tool
 
     def _create_tool_executor(self, tool_def: ToolDefinition):
-        """Creates an executor function for the tool"""
+        """Creates a sync executor bridged onto the service event loop"""
 
-        async def execute(**kwargs):
-            # Tool execution logic here
-            return f"Executed {tool_def.name} with {kwargs}"
+        def execute(**kwargs):
+            return self.run_sync(self._execute_tool(tool_def, kwargs))
 
         return execute
 
+    async def _execute_tool(self, tool_def: ToolDefinition, arguments: Dict[str, Any]):
+        """Execute a tool through the result cache and single-flight coalescing"""
+        cacheable = self.cache is not None and tool_def.cache_enabled
+        coalesce = self._should_coalesce(tool_def)
+
+        if not cacheable and not coalesce:
+            return await self._request_tool(tool_def, arguments)
+
+        key = ToolResultCache.make_key(tool_def.name, arguments)
+
+        if cacheable:
+            result = self.cache.get(key, _MISSING)
+            if result is not _MISSING:
+                return result
+
+        if coalesce:
+            result = await self._single_flight(
+                key, lambda: self._request_tool(tool_def, arguments)
+            )
+        else:
+            result = await self._request_tool(tool_def, arguments)
+
+        if cacheable:
+            self.cache.set(key, result)
+
+        return result
+
+    def _should_coalesce(self, tool_def: ToolDefinition) -> bool:
+        """Coalescing is enabled per tool or for every tool of a service"""
+        if tool_def.coalesce:
+            return True
+
+        service = next(
+            (s for s in self.tool_services if s.name == tool_def.service), None
+        )
+        return service is not None and service.coalesce
+
+    async def _single_flight(self, key: Any, request):
+        """Run request once per key, concurrent duplicates await the same future"""
+        task = self._inflight.get(key)
+
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(request())
+            self._inflight[key] = task
+
+            def _release(done: asyncio.Future):
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            task.add_done_callback(_release)
+
+        # Shield so a cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+
+    async def _request_tool(self, tool_def: ToolDefinition, arguments: Dict[str, Any]):
+        """POST validated arguments to the tool endpoint and read the bounded result"""
+        streaming = self.settings.get("streaming", {})
+        overflow = streaming.get("overflow", "truncate")
+
+        if overflow not in OVERFLOW_POLICIES:
+            logger.warning(f"Unknown streaming overflow policy '{overflow}'")
+            overflow = "truncate"
+
+        try:
+            async with self._open_tool_stream(tool_def, arguments) as response:
+                return await read_response(
+                    response,
+                    max_bytes=streaming.get("max_result_bytes", 10 * 1024 * 1024),
+                    overflow=overflow,
+                    spill_dir=streaming.get("spill_dir")
+                    or Path(self.config_manager.storage_dir) / "tool_results",
+                    name=tool_def.name,
+                    max_spill_files=streaming.get("max_spill_files", MAX_SPILL_FILES),
+                )
+        except ResultTooLargeError as e:
+            raise ToolExecutionError(f"Tool '{tool_def.name}' failed: {e}") from e
+
+    @asynccontextmanager
+    async def _open_tool_stream(
+        self, tool_def: ToolDefinition, arguments: Dict[str, Any]
+    ) -> AsyncIterator[httpx.Response]:
+        """Send the tool request and yield the response for its body to be read
+
+        The limiter slot stays held and the outcome is recorded only once the
+        body has been consumed or closed, so stalled bodies count as failures.
+        """
+        client = self._http_clients.get(tool_def.service)
+
+        if client is None:
+            raise ToolExecutionError(
+                f"No HTTP client for service '{tool_def.service}' of tool '{tool_def.name}'"
+            )
+
+        timeout = (
+            tool_def.timeout
+            if tool_def.timeout is not None
+            else httpx.USE_CLIENT_DEFAULT
+        )
+        request = client.build_request(
+            "POST", tool_def.endpoint, json=arguments, timeout=timeout
+        )
+
+        try:
+            async with self._guarded(tool_def.service) as outcome:
+                response = await client.send(request, stream=True)
+                try:
+                    if response.is_error:
+                        # Client errors are the caller's fault, only 5xx count
+                        outcome.failed = response.status_code >= 500
+                        raise ToolExecutionError(
+                            f"Tool '{tool_def.name}' failed: HTTP {response.status_code}"
+                        )
+                    yield response
+                finally:
+                    await response.aclose()
+        except httpx.HTTPError as e:
+            raise ToolExecutionError(f"Tool '{tool_def.name}' failed: {e}") from e
+
+    async def stream_tool(
+        self, name: str, arguments: Dict[str, Any]
+    ) -> AsyncIterator[Any]:
+        """Yield a tool result incrementally: NDJSON records or raw byte chunks
+
+        Must be consumed on the service loop; use iter_tool from other threads.
+        """
+        registry = self._registry
+        tool_def = registry.definitions.get(name)
+
+        if tool_def is None:
+            raise ToolExecutionError(f"Unknown tool '{name}'")
+
+        arguments = (
+            registry.get(name).args_schema.model_validate(arguments).model_dump()
+        )
+        async with self._open_tool_stream(tool_def, arguments) as response:
+            async for item in iter_response(response):
+                yield item
+
+    def iter_tool(self, name: str, arguments: Dict[str, Any]) -> Iterator[Any]:
+        """Sync facade over stream_tool, each item is pulled through the service loop"""
+        stream = self.stream_tool(name, arguments)
+
+        try:
+            while True:
+                try:
+                    yield self.run_sync(stream.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self.run_sync(stream.aclose())
+
+    def execute_batch(
+        self, calls: List[Tuple[str, Dict[str, Any]]], timeout: Optional[float] = None
+    ) -> List[ToolCallResult]:
+        """Execute independent (tool, args) calls, results are returned in order"""
+        return self.run_sync(self.execute_batch_async(calls), timeout)
+
+    async def execute_batch_async(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[ToolCallResult]:
+        """Group calls per service and dispatch each group concurrently"""
+        registry = self._registry
+        results: List[Optional[ToolCallResult]] = [None] * len(calls)
+        groups: Dict[str, List[Tuple[int, ToolDefinition, Dict[str, Any]]]] = {}
+
+        for index, (name, arguments) in enumerate(calls):
+            tool_def = registry.definitions.get(name)
+
+            if tool_def is None:
+                results[index] = ToolCallResult(
+                    tool=name, error=f"Unknown tool '{name}'"
+                )
+                continue
+
+            try:
+                arguments = (
+                    registry.get(name)
+                    .args_schema.model_validate(arguments)
+                    .model_dump()
+                )
+            except ValidationError as e:
+                results[index] = ToolCallResult(tool=name, error=str(e))
+                continue
+
+            groups.setdefault(tool_def.service, []).append((index, tool_def, arguments))
+
+        await asyncio.gather(
+            *(
+                self._execute_service_batch(service, items, results)
+                for service, items in groups.items()
+            )
+        )
+        return results
+
+    def _get_batch_endpoint(self, service_name: str) -> Optional[str]:
+        """Path of the batch endpoint advertised in the service config, if any"""
+        for service in self.tool_services:
+            if service.name != service_name:
+                continue
+
+            for endpoint in service.endpoints:
+                if endpoint["method"] == "POST" and endpoint["path"].rstrip(
+                    "/"
+                ).endswith("/batch"):
+                    return endpoint["path"]
+
+        return None
+
+    async def _execute_service_batch(
+        self,
+        service_name: str,
+        items: List[Tuple[int, ToolDefinition, Dict[str, Any]]],
+        results: List[Optional[ToolCallResult]],
+    ):
+        """Run the calls of one service through its batch endpoint or concurrently"""
+        batch_path = self._get_batch_endpoint(service_name)
+
+        if batch_path is None:
+            outcomes = await asyncio.gather(
+                *(self._execute_tool(tool_def, args) for _, tool_def, args in items),
+                return_exceptions=True,
+            )
+            for (index, tool_def, _), outcome in zip(items, outcomes):
+                if isinstance(outcome, Exception):
+                    results[index] = ToolCallResult(
+                        tool=tool_def.name, error=str(outcome)
+                    )
+                else:
+                    results[index] = ToolCallResult(tool=tool_def.name, result=outcome)
+            return
+
+        pending = []
+        for index, tool_def, arguments in items:
+            if self.cache is not None and tool_def.cache_enabled:
+                key = ToolResultCache.make_key(tool_def.name, arguments)
+                cached = self.cache.get(key, _MISSING)
+                if cached is not _MISSING:
+                    results[index] = ToolCallResult(tool=tool_def.name, result=cached)
+                    continue
+
+            pending.append((index, tool_def, arguments))
+
+        if not pending:
+            return
+
+        try:
+            outcomes = await self._request_batch(service_name, batch_path, pending)
+        except ToolExecutionError as e:
+            for index, tool_def, _ in pending:
+                results[index] = ToolCallResult(tool=tool_def.name, error=str(e))
+            return
+
+        for (index, tool_def, arguments), outcome in zip(pending, outcomes):
+            if outcome.get("error") is not None:
+                results[index] = ToolCallResult(
+                    tool=tool_def.name, error=str(outcome["error"])
+                )
+                continue
+
+            result = outcome.get("result")
+            results[index] = ToolCallResult(tool=tool_def.name, result=result)
+
+            if self.cache is not None and tool_def.cache_enabled:
+                self.cache.set(
+                    ToolResultCache.make_key(tool_def.name, arguments), result
+                )
+
+    async def _request_batch(
+        self,
+        service_name: str,
+        batch_path: str,
+        items: List[Tuple[int, ToolDefinition, Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """POST several calls to a service batch endpoint in one request"""
+        client = self._http_clients.get(service_name)
+
+        if client is None:
+            raise ToolExecutionError(f"No HTTP client for service '{service_name}'")
+
+        payload = {
+            "calls": [
+                {"tool": tool_def.name, "arguments": arguments}
+                for _, tool_def, arguments in items
+            ]
+        }
+
+        try:
+            response = await self._send(
+                service_name, lambda: client.post(batch_path, json=payload)
+            )
+            response.raise_for_status()
+            outcomes = response.json()["results"]
+        except (httpx.HTTPError, ValueError, KeyError) as e:
+            raise ToolExecutionError(f"Batch call to {service_name} failed: {e}") from e
+
+        if len(outcomes) != len(items):
+            raise ToolExecutionError(
+                f"Batch call to {service_name} returned {len(outcomes)} results "
+                f"for {len(items)} calls"
+            )
+
+        return outcomes
+
+    async def _send(self, service_name: str, request) -> httpx.Response:
+        """Send a request through the service circuit breaker and concurrency limiter"""
+        async with self._guarded(service_name) as outcome:
+            response = await request()
+            # Client errors are the caller's fault, only 5xx count against it
+            outcome.failed = response.status_code >= 500
+            return response
+
+    @asynccontextmanager
+    async def _guarded(self, service_name: str) -> AsyncIterator[CallOutcome]:
+        """Hold a breaker admission and a limiter slot for the body of the block
+
+        The block sets `failed` on the yielded outcome once it has judged the
+        response, leaving it unset counts as success. httpx errors are failures,
+        other errors without a verdict (cancellation, a closed client) only give
+        back the half-open slot.
+        """
+        outcome = CallOutcome()
+        breaker = self._breakers.get(service_name)
+        limiter = self._limiters.get(service_name)
+
+        if breaker is None or limiter is None:
+            yield outcome
+            return
+
+        if not breaker.allow():
+            raise ToolServiceUnavailableError(
+                f"Tool service '{service_name}' is unavailable (circuit {breaker.state})"
+            )
+
+        recorded = False
+        try:
+            async with limiter:
+                started = time.monotonic()
+
+                def record(failed: bool):
+                    nonlocal recorded
+                    recorded = True
+                    limiter.record(time.monotonic() - started, failed=failed)
+                    if failed:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+
+                try:
+                    yield outcome
+                except httpx.HTTPError:
+                    record(True)
+                    raise
+                except BaseException:
+                    if outcome.failed is not None:
+                        record(outcome.failed)
+                    raise
+
+                record(bool(outcome.failed))
+        finally:
+            # Calls that end without a verdict must not hold a half-open probe slot
+            if not recorded:
+                breaker.release()
+
+    def service_health(self) -> Dict[str, Dict[str, Any]]:
+        """Circuit state and current concurrency limit per tool service"""
+        return {
+            name: {
+                "state": breaker.state,
+                "failures": breaker.failures,
+                "concurrency_limit": int(self._limiters[name].limit),
+                "inflight": self._limiters[name].inflight,
+            }
+            for name, breaker in self._breakers.items()
+        }
+
     async def refresh_tools(self):
-        """Refresh tools while maintaining existing ones"""
+        """Refresh tools, the current snapshot stays live if the refresh fails"""
         async with self._refresh_lock:
-            existing_tools = self.tools.copy()
-            try:
-                await self.load_tools()
-                logger.debug(f"Successfully refreshed {len(self.tools)} tools")
-            except Exception as e:
-                self.tools = existing_tools
-                logger.error(f"Failed to refresh tools: {e}")
-                raise
+            await self._refresh()
+
+    async def _refresh(self):
+        """Load tools and log the outcome, callers must hold the refresh lock"""
+        try:
+            await self.load_tools()
+            logger.debug(f"Successfully refreshed {len(self._registry.tools)} tools")
+        except Exception as e:
+            logger.error(f"Failed to refresh tools: {e}")
+            raise
 
     async def initialize(self):
         """Initialize the tool service"""
         await self._init_clients()
         await self.load_tools()
 
+    async def _revalidate(self):
+        """Initialize clients and refresh tools loaded from the snapshot"""
+        await self._init_clients()
+        try:
+            await self.refresh_tools()
+        except Exception:
+            # Already logged by refresh_tools, keep serving the snapshot
+            pass
+
+    async def _refresh_forever(self, interval: float):
+        """Periodically refresh tools until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh_tools()
+            except Exception:
+                # Already logged by refresh_tools, keep serving the last registry
+                continue
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the dedicated event loop thread on first use"""
+        with self._loop_lock:
+            if self._thread is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="cognition-tool-service",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    def run_sync(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the service loop and block for its result"""
+        loop = self._ensure_loop()
+
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("run_sync cannot be called from the tool service loop")
+
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+    def start(self):
+        """Load tools on the service loop and keep them refreshed"""
+        if self._started:
+            return
+
+        if self._load_snapshot():
+            # Serve the snapshot now, revalidate against the services in background
+            asyncio.run_coroutine_threadsafe(self._revalidate(), self._ensure_loop())
+        else:
+            self.run_sync(self.initialize())
+
+        self._started = True
+        self._schedule_refresh()
+        self._unsubscribe = self.config_manager.subscribe(
+            "tools", self._on_config_change
+        )
+
+    def _schedule_refresh(self):
+        """Start the periodic refresh task on the service loop if enabled"""
+        interval = self.settings.get("refresh", {}).get("interval", 300)
+        if interval:
+            self._refresh_task = asyncio.run_coroutine_threadsafe(
+                self._refresh_forever(interval), self._loop
+            )
+
+    def stop(self):
+        """Stop background refresh, close clients and the event loop"""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+        if self._thread is None:
+            return
+
+        self.run_sync(self.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+        self._started = False
+
     async def close(self):
         """Cleanup resources"""
-        for client in self._http_clients.values():
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+        # Clients and coalesced calls are bound to this loop, a restart needs new ones
+        clients, self._http_clients = self._http_clients, {}
+        for client in clients.values():
             await client.aclose()
 
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return tool result cache counters, empty when caching is disabled"""
+        return self.cache.stats() if self.cache is not None else {}
+
+    @property
+    def tools(self) -> MappingProxyType:
+        """Read-only view of the tools in the current snapshot"""
+        return self._registry.tools
+
+    @property
+    def version(self) -> int:
+        """Version of the current registry snapshot"""
+        return self._registry.version
+
+    def snapshot(self) -> ToolRegistry:
+        """Return the current registry snapshot for consistent multi-tool reads"""
+        return self._registry
+
     def get_tool(self, name: str) -> Optional[CrewStructuredTool]:
         """Retrieve a specific tool by name"""
-        return self.tools.get(name)
+        return self._registry.get(name)
 
     def list_tools(self) -> List[str]:
         """List all available tool names"""
-        logger.info(f"Available tools: {list(self.tools.keys())}")
-        return list(self.tools.keys())
+        return self._registry.names()
@@ -0,0 +1,395 @@
+from cognition_core.config import ConfigManager, ParsedConfigCache
+from cognition_core.config_sync import RemoteConfigSync
+from copy import deepcopy
+from pathlib import Path
+import subprocess
+import threading
+import textwrap
+import pytest
+import json
+import time
+import sys
+import os
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+IMPORT_BUDGET_SECONDS = 0.5
+
+
+@pytest.fixture(autouse=True)
+def storage_dir(tmp_path, monkeypatch):
+    """Keep the persisted parsed-config cache out of the real CrewAI storage dir"""
+    storage = tmp_path / "storage"
+    monkeypatch.setattr("crewai.utilities.paths.db_storage_path", lambda: str(storage))
+    return storage
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """Config directory with a couple of YAML files, used by a fresh ConfigManager"""
+    (tmp_path / "crew.yaml").write_text("debug_routellm: false\nname: demo\n")
+    (tmp_path / "memory.yaml").write_text("embedder:\n  provider: ollama\n")
+    monkeypatch.setenv("COGNITION_CONFIG_DIR", str(tmp_path))
+    monkeypatch.delenv("COGNITION_CONFIG_SOURCE", raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def manager(config_dir):
+    manager = ConfigManager()
+    with manager.config_scope():
+        yield manager
+
+
+def git(*args, cwd):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        capture_output=True,
+        check=True,
+    )
+
+
+def push_config(work: Path, files: dict):
+    """Commit config files in the working clone and push them to the remote"""
+    for name, content in files.items():
+        (work / "config").mkdir(exist_ok=True)
+        (work / "config" / name).write_text(content)
+    git("add", "-A", cwd=work)
+    git("commit", "-q", "-m", "update config", cwd=work)
+    git("push", "-q", "origin", "HEAD", cwd=work)
+
+
+@pytest.fixture
+def remote_repo(tmp_path):
+    """Local bare repo standing in for the remote config source, plus a clone"""
+    bare, work = tmp_path / "remote.git", tmp_path / "work"
+    git("init", "-q", "--bare", str(bare), cwd=tmp_path)
+    git("clone", "-q", str(bare), str(work), cwd=tmp_path)
+    push_config(
+        work,
+        {
+            "crew.yaml": "debug_routellm: false\nname: demo\n",
+            "memory.yaml": "embedder:\n  provider: ollama\n",
+        },
+    )
+    return bare, work
+
+
+class TestLazyImport:
+    def test_import_is_cheap_and_side_effect_free(self, tmp_path):
+        """Test that importing the package does no work until services are used."""
+        # Arrange
+        script = textwrap.dedent("""
+            import json, sys, threading, time
+            started = time.perf_counter()
+            import cognition_core
+            import cognition_core.config
+            import cognition_core.logger
+            elapsed = time.perf_counter() - started
+            print(json.dumps({
+                "elapsed": elapsed,
+                "crewai": "crewai" in sys.modules,
+                "manager": cognition_core.config._config_manager is not None,
+                "threads": threading.active_count(),
+            }))
+            """)
+        env = {
+            key: value
+            for key, value in os.environ.items()
+            if not key.startswith("COGNITION_")
+        }
+        env["PYTHONPATH"] = str(SRC_DIR)
+
+        # Act
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=tmp_path,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        result = json.loads(output.stdout.strip().splitlines()[-1])
+
+        # Assert
+        assert result["elapsed"] < IMPORT_BUDGET_SECONDS
+        assert result["crewai"] is False
+        assert result["manager"] is False
+        assert result["threads"] == 1
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestConfigSnapshot:
+    def test_env_overrides_are_precomputed(self, manager, monkeypatch):
+        """Test that env overrides are applied once per reload without mutation."""
+        # Arrange
+        monkeypatch.setenv("CREW_NAME", "from-env")
+        manager._load_configs()
+
+        # Act
+        resolved = manager.get_config("crew")
+        raw = manager.get_config("crew", validate=False)
+
+        # Assert
+        assert resolved["name"] == "from-env"
+        assert raw["name"] == "demo"
+        assert manager.get_config("crew") is resolved
+
+    def test_nested_views_are_read_only(self, manager):
+        """Test that readers cannot change what later readers of a config see."""
+        # Arrange
+        memory = manager.get_config("memory")
+
+        # Act
+        with pytest.raises(TypeError):
+            memory["embedder"]["provider"] = "openai"
+        copy = deepcopy(memory)
+        copy["embedder"]["provider"] = "openai"
+
+        # Assert
+        assert manager.get_config("memory")["embedder"]["provider"] == "ollama"
+        assert manager.get_memory_config()["embedder"]["provider"] == "ollama"
+        assert json.loads(json.dumps(memory)) == {"embedder": {"provider": "ollama"}}
+
+    def test_missing_config_fails_fast(self, manager):
+        """Test that lookups of unknown configs do not sleep and retry."""
+        # Act
+        started = time.perf_counter()
+        with pytest.raises(KeyError):
+            manager.get_config("missing")
+
+        # Assert
+        assert time.perf_counter() - started < 0.05
+
+    def test_reload_publishes_new_version(self, manager, config_dir):
+        """Test that a reload swaps in a new snapshot with a higher version."""
+        # Arrange
+        before = manager.snapshot()
+        (config_dir / "crew.yaml").write_text("name: changed\n")
+        manager.last_reload.clear()
+
+        # Act
+        manager._load_configs()
+
+        # Assert
+        assert manager.version > before.version
+        assert manager.get_config("crew")["name"] == "changed"
+        assert before.raw["crew"]["name"] == "demo"
+
+    def test_repeated_reload_publishes_once(self, manager, config_dir):
+        """Test that reloading a file the watcher already picked up is a no-op."""
+        # Arrange
+        manager.observer.stop()  # reload explicitly, as sync and watcher would
+        manager.observer.join()
+        path = config_dir / "crew.yaml"
+        path.write_text("name: merged\n")
+        manager.reload_files([path])
+        version = manager.version
+
+        # Act
+        manager.reload_files([path])
+
+        # Assert
+        assert manager.version == version
+        assert manager.get_config("crew")["name"] == "merged"
+
+    def test_reloads_wait_for_each_other(self, manager, config_dir):
+        """Test that a reload from another thread waits for the one in progress."""
+        # Arrange
+        path = config_dir / "crew.yaml"
+        path.write_text("name: synced\n")
+        reloader = threading.Thread(target=manager.reload_files, args=([path],))
+
+        # Act
+        with manager._reload_lock:
+            reloader.start()
+            reloader.join(0.2)
+            waited = reloader.is_alive()
+        reloader.join()
+
+        # Assert
+        assert waited
+        assert manager.get_config("crew")["name"] == "synced"
+
+
+class TestParsedConfigCache:
+    def test_unchanged_file_is_not_reparsed_across_processes(self, tmp_path):
+        """Test that a fresh cache on the same dir reuses the persisted parse."""
+        # Arrange
+        path = tmp_path / "agents.yaml"
+        path.write_text("researcher:\n  role: Researcher\n")
+        ParsedConfigCache(tmp_path / "cache").load(path)
+        cache = ParsedConfigCache(tmp_path / "cache")
+
+        # Act
+        config = cache.load(path)
+
+        # Assert
+        assert config == {"researcher": {"role": "Researcher"}}
+        assert cache.parses == 0
+
+    def test_changed_content_is_reparsed(self, tmp_path):
+        """Test that a content change invalidates the cached parse."""
+        # Arrange
+        path = tmp_path / "agents.yaml"
+        path.write_text("role: a\n")
+        cache = ParsedConfigCache(tmp_path / "cache")
+        cache.load(path)
+        path.write_text("role: b\n")
+
+        # Act
+        config = cache.load(path)
+
+        # Assert
+        assert config == {"role": "b"}
+        assert cache.parses == 2
+
+    def test_entries_are_persisted_as_json(self, tmp_path):
+        """Test that persisted parses are plain JSON data, not pickles."""
+        # Arrange
+        path = tmp_path / "agents.yaml"
+        path.write_text("researcher:\n  role: Researcher\n")
+        cache = ParsedConfigCache(tmp_path / "cache")
+
+        # Act
+        cache.load(path)
+
+        # Assert
+        [entry] = (tmp_path / "cache").iterdir()
+        digest, config = json.loads(entry.read_text())
+        assert config == {"researcher": {"role": "Researcher"}}
+
+    def test_configs_json_cannot_hold_are_not_persisted(self, tmp_path):
+        """Test that integer keys are re-parsed instead of coming back as strings."""
+        # Arrange
+        path = tmp_path / "ports.yaml"
+        path.write_text("8080: web\n")
+        ParsedConfigCache(tmp_path / "cache").load(path)
+        cache = ParsedConfigCache(tmp_path / "cache")
+
+        # Act
+        config = cache.load(path)
+
+        # Assert
+        assert config == {8080: "web"}
+        assert cache.parses == 1
+
+    def test_reload_skips_unchanged_files(self, manager, config_dir):
+        """Test that a full reload only parses the files that changed."""
+        # Arrange
+        manager.observer.stop()  # count only the explicit reload's parses
+        manager.observer.join()
+        parses = manager._parsed.parses
+        (config_dir / "crew.yaml").write_text("name: changed\n")
+        manager.last_reload.clear()
+
+        # Act
+        manager._load_configs()
+
+        # Assert
+        assert manager._parsed.parses == parses + 1
+        assert manager.get_config("crew")["name"] == "changed"
+
+
+class TestConfigSubscriptions:
+    def test_subscriber_receives_diff(self, manager, config_dir):
+        """Test that subscribers get a diff for the configs they registered."""
+        # Arrange
+        changes = []
+        manager.subscribe(["crew"], changes.append)
+        (config_dir / "crew.yaml").write_text("debug_routellm: false\nname: next\n")
+        manager.last_reload.clear()
+
+        # Act
+        manager._load_configs()
+        manager._load_configs()
+
+        # Assert
+        assert len(changes) == 1
+        assert changes[0].name == "crew"
+        assert changes[0].modified == {"name"}
+        assert changes[0].new["name"] == "next"
+
+    def test_unsubscribe_and_weak_methods(self, manager, config_dir):
+        """Test that removed and garbage-collected subscribers are not called."""
+        # Arrange
+        calls = []
+
+        class Component:
+            def on_change(self, change):
+                calls.append(change)
+
+        component = Component()
+        manager.subscribe("memory", component.on_change)
+        unsubscribe = manager.subscribe("memory", calls.append)
+        unsubscribe()
+        del component
+        (config_dir / "memory.yaml").write_text("embedder:\n  provider: openai\n")
+        manager.last_reload.clear()
+
+        # Act
+        manager._load_configs()
+
+        # Assert
+        assert calls == []
+        assert manager._subscribers == []
+
+
+class TestRemoteConfigSync:
+    def test_existing_checkout_is_reused(self, remote_repo, tmp_path):
+        """Test that startup reuses the checkout instead of wiping and recloning."""
+        # Arrange
+        bare, _ = remote_repo
+        sync = RemoteConfigSync(str(bare), tmp_path / "checkout")
+        checkout = sync.ensure_checkout()
+        (checkout / "marker").write_text("kept")
+
+        # Act
+        RemoteConfigSync(str(bare), tmp_path / "checkout").ensure_checkout()
+
+        # Assert
+        assert (checkout / "marker").read_text() == "kept"
+        assert (checkout / "config" / "crew.yaml").exists()
+
+    def test_sync_reports_only_changed_files(self, remote_repo, tmp_path):
+        """Test that a sync fast-forwards and returns just the files that changed."""
+        # Arrange
+        bare, work = remote_repo
+        sync = RemoteConfigSync(str(bare), tmp_path / "checkout")
+        checkout = sync.ensure_checkout()
+        push_config(work, {"crew.yaml": "name: remote\n"})
+
+        # Act
+        changed = sync.sync()
+        unchanged = sync.sync()
+
+        # Assert
+        assert changed == [checkout / "config" / "crew.yaml"]
+        assert (checkout / "config" / "crew.yaml").read_text() == "name: remote\n"
+        assert unchanged == []
+
+    def test_manager_reloads_changed_files(self, remote_repo, tmp_path, monkeypatch):
+        """Test that the manager re-parses only synced files and publishes them."""
+        # Arrange
+        bare, work = remote_repo
+        checkout = tmp_path / "checkout"
+        monkeypatch.setenv("COGNITION_CONFIG_SOURCE", str(bare))
+        monkeypatch.setenv("COGNITION_CONFIG_CHECKOUT", str(checkout))
+        monkeypatch.setenv("COGNITION_CONFIG_DIR", str(checkout / "config"))
+        monkeypatch.setenv("COGNITION_CONFIG_SYNC_INTERVAL", "0")
+        manager = ConfigManager()
+        loaded = []
+        load_file = manager._load_file
+        monkeypatch.setattr(
+            manager, "_load_file", lambda path: loaded.append(path) or load_file(path)
+        )
+        push_config(work, {"crew.yaml": "name: remote\n"})
+
+        # Act
+        with manager.config_scope():
+            manager._on_remote_change(manager._remote_sync.sync())
+
+        # Assert
+        assert {path.name for path in loaded} == {"crew.yaml"}
+        assert manager.get_config("crew")["name"] == "remote"
+        assert manager.get_config("memory")["embedder"]["provider"] == "ollama"
@@ -0,0 +1,994 @@
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS
+from cognition_core.memory.long_term import MIGRATIONS, LTMPostgresStorage
+from cognition_core.memory.long_term import CustomLongTermMemory
+from crewai.memory.long_term.long_term_memory_item import LongTermMemoryItem
+from cognition_core.memory.pool import PoolTimeoutError, PostgresConnectionPool
+from cognition_core.memory.long_term_sqlite import LTMSQLiteFTSStorage
+from cognition_core.memory.write_behind import WriteBehindBuffer
+from cognition_core.memory.mem_svc import MemoryService
+from chromadb import Documents, EmbeddingFunction, Embeddings
+from cognition_core.memory.embedding_cache import EmbeddingCache
+from cognition_core.memory.vector_store import NumpyVectorStorage
+from cognition_core.memory.storage import ChromaRAGStorage
+from cognition_core.memory import storage as storage_module
+from cognition_core.memory import long_term, vector_store, write_behind
+from unittest.mock import MagicMock
+import threading
+import weakref
+import numpy as np
+import psycopg2
+import chromadb
+import pytest
+import queue
+import time
+import uuid
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        if self.conn.broken:
+            raise psycopg2.OperationalError("server closed the connection")
+        self.conn.status = TRANSACTION_STATUS_INTRANS
+        self.conn.queries.append(" ".join(query.split()))
+
+    def fetchall(self):
+        return list(self.conn.rows)
+
+
+class FakeConnection:
+    """Just enough of a psycopg2 connection to exercise the pool"""
+
+    def __init__(self):
+        self.closed = 0
+        self.broken = False
+        self.status = TRANSACTION_STATUS_IDLE
+        self.queries = []
+        self.rows = []
+        self.commits = 0
+
+    def cursor(self, **kwargs):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+        self.status = TRANSACTION_STATUS_IDLE
+
+    def rollback(self):
+        self.status = TRANSACTION_STATUS_IDLE
+
+    def get_transaction_status(self):
+        return self.status
+
+    def close(self):
+        self.closed = 1
+
+
+@pytest.fixture
+def make_pool():
+    """Pool factory whose connections are FakeConnections recorded in `opened`"""
+    opened = []
+
+    def connect(dsn):
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    def factory(**kwargs):
+        pool = PostgresConnectionPool("postgresql://test", connect=connect, **kwargs)
+        pool.opened = opened
+        return pool
+
+    return factory
+
+
+class TestPostgresConnectionPool:
+    def test_connections_are_reused(self, make_pool):
+        """Test that sequential checkouts share one physical connection."""
+        # Arrange
+        pool = make_pool()
+
+        # Act
+        for _ in range(3):
+            with pool.connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+
+        # Assert
+        assert len(pool.opened) == 1
+        assert pool.opened[0].commits == 3
+        assert pool.stats() == {"size": 1, "idle": 1, "in_use": 0}
+
+    def test_exhausted_pool_waits_then_times_out(self, make_pool):
+        """Test that callers beyond max_size wait for a returned connection."""
+        # Arrange
+        pool = make_pool(max_size=1)
+        held = pool.getconn()
+
+        # Act
+        with pytest.raises(PoolTimeoutError):
+            pool.getconn(timeout=0.05)
+        threading.Timer(0.05, pool.putconn, args=(held,)).start()
+        reused = pool.getconn(timeout=1)
+
+        # Assert
+        assert reused is held
+        assert len(pool.opened) == 1
+
+    def test_unhealthy_connection_is_replaced(self, make_pool):
+        """Test that a connection failing its health check is discarded."""
+        # Arrange
+        pool = make_pool(health_check_interval=0)
+        broken = pool.getconn()
+        pool.putconn(broken)
+        broken.broken = True
+
+        # Act
+        conn = pool.getconn()
+
+        # Assert
+        assert conn is not broken
+        assert broken.closed
+        assert pool.stats()["size"] == 1
+
+    def test_idle_connections_are_recycled(self, make_pool):
+        """Test that connections idle beyond max_idle are closed above min_size."""
+        # Arrange
+        pool = make_pool(min_size=0, max_idle=0)
+        first = pool.getconn()
+        pool.putconn(first)
+
+        # Act
+        second = pool.getconn()
+
+        # Assert
+        assert first.closed
+        assert second is not first
+
+    def test_expired_connections_behind_the_newest_are_swept(
+        self, make_pool, monkeypatch
+    ):
+        """Test that idle connections older than the one checked out are recycled."""
+        # Arrange
+        clock = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+        pool = make_pool(min_size=0, max_idle=10)
+        oldest, newest = pool.getconn(), pool.getconn()
+        pool.putconn(oldest)
+        clock[0] += 5
+        pool.putconn(newest)
+
+        # Act
+        clock[0] += 6
+        conn = pool.getconn()
+
+        # Assert
+        assert conn is newest
+        assert oldest.closed
+        assert pool.stats() == {"size": 1, "idle": 0, "in_use": 1}
+
+    def test_shared_pool_closes_with_last_release(self):
+        """Test that storages on one database share a pool until all release it."""
+        # Arrange
+        dsn = f"postgresql://shared-{uuid.uuid4().hex}"
+        first = PostgresConnectionPool.shared(dsn)
+        second = PostgresConnectionPool.shared(dsn, {"max_size": 2})
+
+        # Act
+        first.release()
+        closed_after_first = first._closed
+        second.release()
+
+        # Assert
+        assert first is second
+        assert first.max_size == 10
+        assert not closed_after_first
+        assert first._closed
+        assert PostgresConnectionPool.shared(dsn) is not first
+
+    def test_open_transaction_is_rolled_back_on_return(self, make_pool):
+        """Test that a failed block does not leak its transaction to the next user."""
+        # Arrange
+        pool = make_pool()
+
+        # Act
+        with pytest.raises(RuntimeError):
+            with pool.connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("INSERT INTO t VALUES (1)")
+                raise RuntimeError("boom")
+
+        # Assert
+        assert conn.status == TRANSACTION_STATUS_IDLE
+        assert conn.commits == 0
+        assert pool.stats()["idle"] == 1
+
+
+class TestLTMPostgresStorage:
+    @pytest.fixture(autouse=True)
+    def fresh_process(self, monkeypatch):
+        """Each test starts like a process that has not migrated anything yet"""
+        monkeypatch.setattr(long_term, "_migrated", set())
+
+    def test_operations_share_pooled_connection(self, make_pool):
+        """Test that init, save, load and reset do not reconnect per call."""
+        # Arrange
+        pool = make_pool()
+        storage = LTMPostgresStorage("postgresql://test", pool=pool)
+        queries = pool.opened[0].queries
+        migration_queries = len(queries)
+
+        # Act
+        storage.save("task", {"quality": 1.0}, "1700000000", 1.0)
+        storage.load("task", 3)
+        storage.reset()
+
+        # Assert
+        assert len(pool.opened) == 1
+        assert len(queries) == migration_queries + 3
+
+    def test_migrations_apply_in_order_and_are_recorded(self, make_pool):
+        """Test that a fresh database gets every migration and its version row."""
+        # Arrange
+        pool = make_pool()
+
+        # Act
+        LTMPostgresStorage("postgresql://test", pool=pool)
+
+        # Assert
+        queries = pool.opened[0].queries
+        recorded = [q for q in queries if "INTO long_term_memory_migrations" in q]
+        assert len(recorded) == len(MIGRATIONS)
+        assert any("created_at TIMESTAMPTZ" in q for q in queries)
+        assert any("gin_trgm_ops" in q for q in queries)
+        assert queries.index(next(q for q in queries if "pg_trgm" in q)) > (
+            queries.index(next(q for q in queries if "ADD COLUMN" in q))
+        )
+
+    def test_backfill_reads_legacy_text_in_configured_zone(self, make_pool):
+        """Test that created_at is backfilled in an explicit zone, not the session's."""
+        # Arrange
+        pool = make_pool()
+
+        # Act
+        LTMPostgresStorage("postgresql://test", pool=pool, timezone="Europe/Berlin")
+
+        # Assert
+        queries = pool.opened[0].queries
+        backfill = next(q for q in queries if q.startswith("UPDATE"))
+        zone = queries[queries.index(backfill) - 2]
+        assert "AT TIME ZONE current_setting('cognition.ltm_timezone')" in backfill
+        assert "set_config('cognition.ltm_timezone'" in zone
+
+    def test_migrations_run_once_per_process(self, make_pool):
+        """Test that further storages on a migrated database skip the migrations."""
+        # Arrange
+        pool = make_pool()
+        LTMPostgresStorage("postgresql://test", pool=pool)
+        migration_queries = len(pool.opened[0].queries)
+
+        # Act
+        LTMPostgresStorage("postgresql://test", pool=pool)
+
+        # Assert
+        assert len(pool.opened[0].queries) == migration_queries
+
+    def test_applied_migrations_are_skipped(self, make_pool):
+        """Test that restarting against a migrated database changes nothing."""
+        # Arrange
+        pool = make_pool()
+        pool.getconn().rows = [(1,)]
+        pool.putconn(pool.opened[0])
+
+        # Act
+        LTMPostgresStorage("postgresql://test", pool=pool)
+
+        # Assert
+        queries = pool.opened[0].queries
+        assert not any("ALTER TABLE" in q or "CREATE INDEX" in q for q in queries)
+
+    def test_load_uses_indexed_ordering(self, make_pool):
+        """Test that search orders by the indexed timestamptz column."""
+        # Arrange
+        pool = make_pool()
+        storage = LTMPostgresStorage("postgresql://test", pool=pool)
+
+        # Act
+        storage.load("task", 3)
+
+        # Assert
+        assert "ORDER BY created_at DESC, id DESC" in pool.opened[0].queries[-1]
+
+
+class TestWriteBehindBuffer:
+    def test_items_are_written_in_batches(self):
+        """Test that queued items are grouped up to batch_size per write."""
+        # Arrange
+        batches = []
+        buffer = WriteBehindBuffer(batches.append, batch_size=3, flush_interval=10)
+
+        # Act
+        for i in range(7):
+            buffer.put(i)
+        buffer.flush()
+        buffer.close()
+
+        # Assert
+        assert [item for batch in batches for item in batch] == list(range(7))
+        assert max(len(batch) for batch in batches) <= 3
+
+    def test_partial_batch_is_written_after_interval(self):
+        """Test that a partial batch does not wait for more items forever."""
+        # Arrange
+        batches = []
+        buffer = WriteBehindBuffer(batches.append, batch_size=100, flush_interval=0.05)
+
+        # Act
+        buffer.put("row")
+        time.sleep(0.3)
+
+        # Assert
+        assert batches == [["row"]]
+        buffer.close()
+
+    def test_full_queue_applies_backpressure(self):
+        """Test that producers block once max_queue items are pending."""
+        # Arrange
+        release = threading.Event()
+        written = []
+
+        def write_batch(batch):
+            release.wait()
+            written.extend(batch)
+
+        buffer = WriteBehindBuffer(write_batch, batch_size=1, max_queue=2)
+        buffer.put(1)
+        time.sleep(0.05)
+        buffer.put(2)
+        buffer.put(3)
+
+        # Act
+        with pytest.raises(queue.Full):
+            buffer.put(4, timeout=0.05)
+        release.set()
+        buffer.close()
+
+        # Assert
+        assert written == [1, 2, 3]
+
+    def test_close_flushes_pending_items(self):
+        """Test that shutdown writes everything still queued."""
+        # Arrange
+        batches = []
+        buffer = WriteBehindBuffer(batches.append, batch_size=100, flush_interval=10)
+        for i in range(5):
+            buffer.put(i)
+
+        # Act
+        buffer.close()
+
+        # Assert
+        assert [item for batch in batches for item in batch] == list(range(5))
+
+    def test_failed_writes_are_retried(self):
+        """Test that a transient write failure does not lose the batch."""
+        # Arrange
+        attempts = []
+
+        def write_batch(batch):
+            attempts.append(batch)
+            if len(attempts) == 1:
+                raise psycopg2.OperationalError("connection reset")
+
+        buffer = WriteBehindBuffer(write_batch, retry_delay=0)
+
+        # Act
+        buffer.put("row")
+        buffer.close()
+
+        # Assert
+        assert attempts == [["row"], ["row"]]
+        assert buffer.written == 1
+        assert buffer.dropped == 0
+
+    def test_exit_hook_closes_open_buffers(self):
+        """Test that buffers still open at exit are flushed by the shared hook."""
+        # Arrange
+        batches = []
+        buffer = WriteBehindBuffer(batches.append, batch_size=100, flush_interval=10)
+        buffer.put("row")
+
+        # Act
+        write_behind._close_open_buffers()
+
+        # Assert
+        assert batches == [["row"]]
+        assert buffer not in write_behind._open_buffers
+
+
+class TestCustomLongTermMemory:
+    def test_write_behind_saves_are_visible_to_search(self):
+        """Test that saves are batched and flushed before a search reads."""
+        # Arrange
+        storage = MagicMock()
+        memory = CustomLongTermMemory(
+            "postgresql://test",
+            storage=storage,
+            write_behind={"enabled": True, "flush_interval": 10},
+        )
+        item = LongTermMemoryItem(
+            agent="researcher",
+            task="summarize",
+            expected_output="summary",
+            datetime="1700000000",
+            quality=0.9,
+            metadata={"quality": 0.9},
+        )
+
+        # Act
+        memory.save(item)
+        memory.save(item)
+        storage.save_many.assert_not_called()
+        memory.search("summarize")
+        memory.close()
+
+        # Assert
+        rows = storage.save_many.call_args.args[0]
+        assert len(rows) == 2
+        assert rows[0]["score"] == 0.9
+        storage.save.assert_not_called()
+        storage.load.assert_called_once_with("summarize", 3)
+
+
+@pytest.fixture
+def sqlite_storage(tmp_path):
+    storage = LTMSQLiteFTSStorage(tmp_path / "ltm.db")
+    yield storage
+    storage.close()
+
+
+class TestLTMSQLiteFTSStorage:
+    def test_substring_search_returns_latest_first(self, sqlite_storage):
+        """Test that FTS search matches substrings, newest first, up to latest_n."""
+        # Arrange
+        sqlite_storage.save("Summarize the quarterly report", {"n": 1}, "100", 0.5)
+        sqlite_storage.save("Translate the report", {"n": 2}, "200", 0.7)
+        sqlite_storage.save("Summarize the annual report", {"n": 3}, "300", 0.9)
+
+        # Act
+        results = sqlite_storage.load("summarize", 5)
+        latest = sqlite_storage.load("report", 1)
+
+        # Assert
+        assert [r["metadata"]["n"] for r in results] == [3, 1]
+        assert [r["task"] for r in latest] == ["Summarize the annual report"]
+        assert results[0]["score"] == 0.9
+
+    def test_short_query_falls_back_to_scan(self, sqlite_storage):
+        """Test that queries shorter than a trigram still match."""
+        # Arrange
+        sqlite_storage.save("Plan Q3", {}, "100", 1.0)
+
+        # Act
+        results = sqlite_storage.load("Q3", 3)
+
+        # Assert
+        assert [r["task"] for r in results] == ["Plan Q3"]
+
+    def test_batched_saves_and_reset(self, sqlite_storage):
+        """Test that save_many lands rows in the index and reset clears both."""
+        # Arrange
+        rows = [
+            {"task_description": f"task {i}", "metadata": {}, "datetime": str(i)}
+            for i in range(50)
+        ]
+        sqlite_storage.save_many([dict(row, score=1.0) for row in rows])
+        found = sqlite_storage.load("task", 100)
+
+        # Act
+        sqlite_storage.reset()
+
+        # Assert
+        assert len(found) == 50
+        assert sqlite_storage.load("task", 100) == []
+
+    def test_uses_wal_journal(self, sqlite_storage):
+        """Test that the database runs in WAL mode for concurrent readers."""
+        # Act
+        mode = sqlite_storage._conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        # Assert
+        assert mode == "wal"
+
+    def test_memory_service_selects_sqlite_backend(self, tmp_path):
+        """Test that backend: sqlite builds the embedded long-term memory."""
+        # Arrange
+        manager = MagicMock()
+        manager.storage_dir = tmp_path
+        manager.get_memory_config.return_value = {
+            "embedder": {"provider": "ollama"},
+            "long_term_memory": {"enabled": True, "backend": "sqlite"},
+        }
+
+        # Act
+        memory = MemoryService(manager).get_long_term_memory()
+
+        # Assert
+        assert isinstance(memory.storage, LTMSQLiteFTSStorage)
+        assert memory.storage.db_path == tmp_path / "long_term_memory_fts.db"
+        memory.close()
+
+    def test_memory_service_closes_built_memories(self, tmp_path):
+        """Test that closing the service stops the write-behind flushers it started."""
+        # Arrange
+        manager = MagicMock()
+        manager.storage_dir = tmp_path
+        manager.get_memory_config.return_value = {
+            "embedder": {"provider": "ollama"},
+            "long_term_memory": {
+                "enabled": True,
+                "backend": "sqlite",
+                "write_behind": {"enabled": True},
+            },
+        }
+        service = MemoryService(manager)
+        memory = service.get_long_term_memory()
+
+        # Act
+        service.close()
+
+        # Assert
+        assert not memory.writer._thread.is_alive()
+
+
+class CountingEmbedder(EmbeddingFunction):
+    """Deterministic embedding function recording every batch it is asked for"""
+
+    def __init__(self):
+        self.calls = []
+
+    @staticmethod
+    def name() -> str:
+        return "counting"
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(list(input))
+        return [[float(len(text)), 1.0, 0.0] for text in input]
+
+
+@pytest.fixture
+def make_storage():
+    """ChromaRAGStorage on an in-process Chroma client with a counting embedder"""
+    storages = []
+
+    def factory(embedding_cache=None, **settings):
+        embedder = CountingEmbedder()
+        storage = ChromaRAGStorage(
+            "localhost",
+            8000,
+            f"test-{uuid.uuid4().hex[:8]}",
+            {"provider": embedder},
+            settings=settings,
+            client=chromadb.EphemeralClient(),
+            embedding_cache=embedding_cache,
+        )
+        storage.embedder = embedder
+        storages.append(storage)
+        return storage
+
+    yield factory
+
+    for storage in storages:
+        storage.flush()
+
+
+class TestChromaWriteBuffer:
+    def test_saves_are_embedded_and_added_in_batches(self, make_storage):
+        """Test that buffered saves cost one embedding call per batch."""
+        # Arrange
+        storage = make_storage(write_buffer={"enabled": True, "max_items": 3})
+
+        # Act
+        for i in range(7):
+            storage.save(f"observation {i}", {"i": i})
+        added_before_flush = storage.collection.count()
+        storage.flush()
+
+        # Assert
+        assert added_before_flush == 6
+        assert storage.collection.count() == 7
+        assert [len(batch) for batch in storage.embedder.calls] == [3, 3, 1]
+
+    def test_partial_buffer_is_flushed_by_age(self, make_storage):
+        """Test that a partial buffer is written once it reaches max_age."""
+        # Arrange
+        storage = make_storage(write_buffer={"enabled": True, "max_age": 0.05})
+
+        # Act
+        storage.save("lonely observation", {})
+        time.sleep(0.3)
+
+        # Assert
+        assert storage.collection.count() == 1
+
+    def test_search_sees_buffered_documents(self, make_storage):
+        """Test that a search flushes pending writes before querying."""
+        # Arrange
+        storage = make_storage(write_buffer={"enabled": True, "max_age": None})
+        storage.save("first", {"n": 1})
+        storage.save("second", {"n": 2})
+
+        # Act
+        results = storage.search("first", limit=5, score_threshold=0)
+
+        # Assert
+        assert {r["context"] for r in results} == {"first", "second"}
+        assert storage.embedder.calls[0] == ["first", "second"]
+
+    def test_exit_hook_holds_buffered_storages_weakly(self, make_storage):
+        """Test that buffered storages are flushed at exit through a weak registry."""
+        # Arrange
+        storage = make_storage(write_buffer={"enabled": True, "max_age": None})
+        storage.save("pending", {"n": 1})
+        collection = storage.collection
+        registered = storage in storage_module._buffered_storages
+
+        # Act
+        storage_module._flush_buffered_storages()
+        flushed = collection.count()
+        storage.close()
+
+        # Assert
+        assert registered
+        assert flushed == 1
+        assert isinstance(storage_module._buffered_storages, weakref.WeakSet)
+        assert storage not in storage_module._buffered_storages
+
+    def test_unbuffered_save_adds_immediately(self, make_storage):
+        """Test that the default mode keeps writing one document per save."""
+        # Arrange
+        storage = make_storage()
+
+        # Act
+        storage.save("observation", {"n": 1})
+
+        # Assert
+        assert storage.collection.count() == 1
+
+
+class TestEmbeddingCache:
+    def test_repeated_texts_are_embedded_once(self):
+        """Test that duplicates and whitespace variants share one embedding."""
+        # Arrange
+        cache = EmbeddingCache()
+        embedder = CountingEmbedder()
+
+        # Act
+        first = cache.embed(["alpha", "beta", "alpha"], embedder, "fp")
+        second = cache.embed(["  alpha\n", "beta"], embedder, "fp")
+
+        # Assert
+        assert embedder.calls == [["alpha", "beta"]]
+        assert np.array_equal(first[0], second[0])
+        assert first[0].dtype == np.float32
+
+    def test_persistent_tier_survives_restart(self, tmp_path):
+        """Test that a new cache on the same file serves earlier embeddings."""
+        # Arrange
+        EmbeddingCache(tmp_path / "emb.db").embed(["alpha"], CountingEmbedder(), "fp")
+        cache = EmbeddingCache(tmp_path / "emb.db")
+        embedder = CountingEmbedder()
+
+        # Act
+        vectors = cache.embed(["alpha"], embedder, "fp")
+
+        # Assert
+        assert embedder.calls == []
+        assert vectors[0].tolist() == [5.0, 1.0, 0.0]
+
+    def test_embedder_config_is_part_of_the_key(self):
+        """Test that a different embedder never reuses another's vectors."""
+        # Arrange
+        cache = EmbeddingCache()
+        embedder = CountingEmbedder()
+        cache.embed(["alpha"], embedder, "model-a")
+
+        # Act
+        cache.embed(["alpha"], embedder, "model-b")
+
+        # Assert
+        assert len(embedder.calls) == 2
+
+    def test_memory_tier_is_bounded(self):
+        """Test that the in-memory tier evicts least recently used entries."""
+        # Arrange
+        cache = EmbeddingCache(max_entries=2)
+
+        # Act
+        cache.embed(["a", "b", "c"], CountingEmbedder(), "fp")
+
+        # Assert
+        assert cache.stats()["entries"] == 2
+
+    def test_storage_save_and_search_share_cache(self, make_storage):
+        """Test that searching for a saved text does not embed it again."""
+        # Arrange
+        storage = make_storage(embedding_cache=EmbeddingCache())
+        storage.save("quarterly revenue grew", {"n": 1})
+
+        # Act
+        results = storage.search("quarterly revenue grew", score_threshold=0)
+
+        # Assert
+        assert storage.embedder.calls == [["quarterly revenue grew"]]
+        assert results[0]["context"] == "quarterly revenue grew"
+
+
+def count_queries(storage):
+    """Wrap collection.query and return the list of recorded calls"""
+    calls = []
+    query = storage.collection.query
+
+    def counting_query(**kwargs):
+        calls.append(kwargs)
+        return query(**kwargs)
+
+    storage.collection.query = counting_query
+    return calls
+
+
+class TestSearchCache:
+    def test_repeated_search_is_served_locally(self, make_storage):
+        """Test that an identical search does not query Chroma again."""
+        # Arrange
+        storage = make_storage(search_cache={"enabled": True})
+        storage.save("release notes", {"n": 1})
+        calls = count_queries(storage)
+
+        # Act
+        first = storage.search("release", score_threshold=0)
+        second = storage.search("release", score_threshold=0)
+
+        # Assert
+        assert len(calls) == 1
+        assert first == second
+
+    def test_save_invalidates_cached_results(self, make_storage):
+        """Test that a write makes the next search see the new document."""
+        # Arrange
+        storage = make_storage(search_cache={"enabled": True})
+        storage.save("release notes", {"n": 1})
+        calls = count_queries(storage)
+        storage.search("release", limit=5, score_threshold=0)
+
+        # Act
+        storage.save("release plan", {"n": 2})
+        results = storage.search("release", limit=5, score_threshold=0)
+
+        # Assert
+        assert len(calls) == 2
+        assert {r["context"] for r in results} == {"release notes", "release plan"}
+
+    def test_entries_expire_after_ttl(self, make_storage):
+        """Test that cached results are dropped once the TTL passes."""
+        # Arrange
+        storage = make_storage(search_cache={"enabled": True, "ttl": 0.05})
+        storage.save("release notes", {"n": 1})
+        calls = count_queries(storage)
+        storage.search("release", score_threshold=0)
+
+        # Act
+        time.sleep(0.1)
+        storage.search("release", score_threshold=0)
+
+        # Assert
+        assert len(calls) == 2
+
+    def test_reset_clears_cached_results(self, make_storage):
+        """Test that reset drops cached searches instead of serving them."""
+        # Arrange
+        storage = make_storage(search_cache={"enabled": True})
+        storage.save("release notes", {"n": 1})
+        storage.search("release", score_threshold=0)
+        # The in-process client refuses resets, only the cache side is under test
+        storage.app = None
+
+        # Act
+        storage.reset()
+
+        # Assert
+        assert len(storage.search_cache) == 0
+
+    def test_disabled_by_default(self, make_storage):
+        """Test that searches always hit Chroma unless the cache is enabled."""
+        # Arrange
+        storage = make_storage()
+        calls = count_queries(storage)
+
+        # Act
+        storage.search("release")
+        storage.search("release")
+
+        # Assert
+        assert len(calls) == 2
+
+
+class KeywordEmbedder(EmbeddingFunction):
+    """Embeds texts as counts of a few keywords, so cosine ranking is predictable"""
+
+    KEYWORDS = ("cat", "dog", "fish")
+
+    def __init__(self):
+        self.calls = []
+
+    @staticmethod
+    def name() -> str:
+        return "keyword"
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(list(input))
+        return [
+            [text.lower().count(word) + 0.01 for word in self.KEYWORDS]
+            for text in input
+        ]
+
+
+@pytest.fixture
+def make_vector_storage(tmp_path):
+    def factory(path=tmp_path / "vectors", **kwargs):
+        embedder = KeywordEmbedder()
+        storage = NumpyVectorStorage(
+            "short_term", path, {"provider": embedder}, **kwargs
+        )
+        storage.embedder = embedder
+        return storage
+
+    return factory
+
+
+class TestNumpyVectorStorage:
+    def test_search_returns_cosine_top_k(self, make_vector_storage):
+        """Test that results are the most similar documents, best first."""
+        # Arrange
+        storage = make_vector_storage()
+        storage.save("cat cat", {"n": 1})
+        storage.save("dog", {"n": 2})
+        storage.save("cat and dog", {"n": 3})
+
+        # Act
+        results = storage.search("cat", limit=2, score_threshold=0)
+
+        # Assert
+        assert [r["metadata"]["n"] for r in results] == [1, 3]
+        assert results[0]["score"] > results[1]["score"]
+
+    def test_threshold_and_filter(self, make_vector_storage):
+        """Test that low scores and non-matching metadata are excluded."""
+        # Arrange
+        storage = make_vector_storage()
+        storage.save("cat", {"agent": "a"})
+        storage.save("cat", {"agent": "b"})
+        storage.save("fish", {"agent": "a"})
+
+        # Act
+        results = storage.search("cat", limit=5, filter={"agent": "a"})
+
+        # Assert
+        assert [r["metadata"] for r in results] == [{"agent": "a"}]
+
+    def test_persisted_store_is_reloaded(self, make_vector_storage):
+        """Test that vectors and records survive a restart without re-embedding."""
+        # Arrange
+        first = make_vector_storage()
+        first.save("dog", {"n": 1})
+        first.save("fish", {"n": 2})
+
+        # Act
+        second = make_vector_storage()
+        results = second.search("fish", limit=1)
+
+        # Assert
+        assert second.count == 2
+        assert second.embedder.calls == [["fish"]]
+        assert results[0]["metadata"] == {"n": 2}
+
+    def test_memory_mapped_matrix_grows_and_persists(
+        self, make_vector_storage, monkeypatch
+    ):
+        """Test that the memory-mapped matrix grows past capacity and reloads."""
+        # Arrange
+        monkeypatch.setattr(vector_store, "INITIAL_CAPACITY", 2)
+        storage = make_vector_storage(mmap=True)
+        for i in range(5):
+            storage.save("dog " * (i + 1), {"n": i})
+        storage.flush()
+
+        # Act
+        reloaded = make_vector_storage(mmap=True)
+        results = reloaded.search("dog", limit=5, score_threshold=0)
+
+        # Assert
+        assert isinstance(reloaded._matrix, np.memmap)
+        assert reloaded.count == 5
+        assert len(results) == 5
+
+    def test_switching_off_mmap_keeps_rows_aligned(self, make_vector_storage):
+        """Test that saves after an mmap run land right after the last stored row."""
+        # Arrange
+        storage = make_vector_storage(mmap=True)
+        storage.save("dog", {"n": 1})
+        storage.save("cat", {"n": 2})
+        storage.flush()
+
+        # Act
+        make_vector_storage().save("fish", {"n": 3})
+        reloaded = make_vector_storage()
+        results = reloaded.search("fish", limit=1)
+
+        # Assert
+        assert reloaded.count == 3
+        assert results[0]["metadata"] == {"n": 3}
+        assert (reloaded.path / reloaded.VECTORS_FILE).stat().st_size == (
+            3 * reloaded.dimension * 4
+        )
+
+    def test_reset_clears_memory_and_disk(self, make_vector_storage):
+        """Test that reset leaves an empty store behind."""
+        # Arrange
+        storage = make_vector_storage()
+        storage.save("cat", {})
+
+        # Act
+        storage.reset()
+
+        # Assert
+        assert storage.search("cat") == []
+        assert make_vector_storage().count == 0
+
+    def test_memory_service_selects_numpy_backend(self, tmp_path):
+        """Test that backend: numpy gives short term memory a local store."""
+        # Arrange
+        manager = MagicMock()
+        manager.storage_dir = tmp_path
+        manager.get_memory_config.return_value = {
+            "embedder": {"provider": KeywordEmbedder()},
+            "short_term_memory": {"enabled": True, "backend": "numpy"},
+        }
+
+        # Act
+        memory = MemoryService(manager).get_short_term_memory()
+        memory.save("cat", {"n": 1})
+
+        # Assert
+        assert isinstance(memory.storage, NumpyVectorStorage)
+        assert memory.storage.path == tmp_path / "vector_store" / "short_term"
+        assert memory.search("cat", score_threshold=0)[0]["context"] == "cat"
+
+    def test_memory_service_flushes_numpy_stores_on_close(self, tmp_path):
+        """Test that closing the service flushes memory-mapped vector stores."""
+        # Arrange
+        manager = MagicMock()
+        manager.storage_dir = tmp_path
+        manager.get_memory_config.return_value = {
+            "embedder": {"provider": KeywordEmbedder()},
+            "short_term_memory": {"enabled": True, "backend": "numpy", "mmap": True},
+            "entity_memory": {"enabled": True, "backend": "numpy", "mmap": True},
+        }
+        service = MemoryService(manager)
+        memories = [service.get_short_term_memory(), service.get_entity_memory()]
+        for memory in memories:
+            memory.storage.flush = MagicMock()
+
+        # Act
+        service.close()
+
+        # Assert
+        for memory in memories:
+            memory.storage.flush.assert_called_once_with()
@@ -0,0 +1,999 @@
+from cognition_core.tools.tool_svc import (
+    ToolDefinition,
+    ToolExecutionError,
+    ToolService,
+    ToolServiceUnavailableError,
+)
+from cognition_core.tools.resilience import AdaptiveLimiter, CircuitBreaker
+from cognition_core.tools.cache import ToolResultCache
+from cognition_core.config import ConfigChange
+from cognition_core.tools import tool_svc
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+import asyncio
+import httpx
+import json
+import threading
+import os
+import pytest
+import time
+
+TOOLS_PAYLOAD = {
+    "tools": [
+        {
+            "name": "calculator",
+            "description": "Basic calculator",
+            "endpoint": "/tools/calculator",
+            "parameters": {
+                "first_number": {"type": "int", "description": "First number"},
+                "second_number": {"type": "int", "description": "Second number"},
+            },
+            "cache_enabled": True,
+        }
+    ]
+}
+
+
+def make_tools_config(settings=None, services=None):
+    return {
+        "tool_services": services
+        or [
+            {
+                "name": "primary",
+                "enabled": True,
+                "base_url": "http://tools.local",
+                "endpoints": [{"path": "/tools", "method": "GET"}],
+            }
+        ],
+        "settings": settings or {},
+    }
+
+
+@pytest.fixture
+def make_service(monkeypatch, tmp_path):
+    """Build a ToolService from an in-memory tools config"""
+
+    services_made = []
+
+    def _make(settings=None, services=None):
+        manager = MagicMock()
+        manager.get_config.return_value = make_tools_config(settings, services)
+        manager.storage_dir = tmp_path
+        monkeypatch.setattr(tool_svc, "get_config_manager", lambda: manager)
+        service = ToolService()
+        services_made.append(service)
+        return service
+
+    yield _make
+
+    for service in services_made:
+        service.stop()
+
+
+def mock_client(handler, base_url="http://tools.local"):
+    return httpx.AsyncClient(base_url=base_url, transport=httpx.MockTransport(handler))
+
+
+def calculator_handler(calls):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.url.path == "/tools":
+            return httpx.Response(200, json=TOOLS_PAYLOAD)
+        body = json.loads(request.content)
+        return httpx.Response(
+            200, json={"result": body["first_number"] + body["second_number"]}
+        )
+
+    return handler
+
+
+class TestToolExecutor:
+    def test_client_pool_settings(self, make_service):
+        """Test that clients are created with the configured pool limits."""
+        # Arrange
+        service = make_service(
+            settings={"http": {"max_connections": 7, "max_keepalive_connections": 3}}
+        )
+
+        # Act
+        limits = service._get_limits()
+
+        # Assert
+        assert limits.max_connections == 7
+        assert limits.max_keepalive_connections == 3
+
+    def test_executor_posts_arguments(self, make_service):
+        """Test that a discovered tool POSTs its validated args to the endpoint."""
+        # Arrange
+        service = make_service()
+        calls = []
+        service._http_clients["primary"] = mock_client(calculator_handler(calls))
+
+        # Act
+        asyncio.run(service.load_tools())
+        tool = service.get_tool("calculator")
+        result = tool.invoke({"first_number": 2, "second_number": 3})
+
+        # Assert
+        assert result == {"result": 5}
+        assert calls[-1].method == "POST"
+        assert calls[-1].url.path == "/tools/calculator"
+
+    def test_executor_raises_on_http_error(self, make_service):
+        """Test that backend failures surface as ToolExecutionError."""
+        # Arrange
+        service = make_service()
+        service._http_clients["primary"] = mock_client(
+            lambda request: httpx.Response(503)
+        )
+        tool_def = ToolDefinition(
+            name="broken", description="Broken", endpoint="/broken", service="primary"
+        )
+
+        # Act & Assert
+        with pytest.raises(ToolExecutionError):
+            asyncio.run(service._execute_tool(tool_def, {}))
+
+
+class TestToolDiscovery:
+    def test_slow_service_returns_partial_results(self, make_service):
+        """Test that a slow service is cut off without blocking the others."""
+        # Arrange
+        services = [
+            {
+                "name": name,
+                "enabled": True,
+                "base_url": "http://tools.local",
+                "endpoints": [{"path": "/tools", "method": "GET"}],
+            }
+            for name in ("fast", "slow")
+        ]
+        service = make_service(
+            settings={"discovery": {"service_timeout": 0.2}}, services=services
+        )
+
+        async def slow_handler(request):
+            await asyncio.sleep(5)
+            return httpx.Response(200, json=TOOLS_PAYLOAD)
+
+        service._http_clients["fast"] = mock_client(calculator_handler([]))
+        service._http_clients["slow"] = mock_client(slow_handler)
+
+        # Act
+        tools = asyncio.run(service.fetch_tool_definitions())
+
+        # Assert
+        assert [tool.service for tool in tools] == ["fast"]
+
+    def test_failing_service_returns_partial_results(self, make_service):
+        """Test that an unexpected error in one service only drops its tools."""
+        # Arrange
+        services = [
+            {
+                "name": name,
+                "enabled": True,
+                "base_url": "http://tools.local",
+                "endpoints": [{"path": "/tools", "method": "GET"}],
+            }
+            for name in ("healthy", "missing")
+        ]
+        service = make_service(services=services)
+        service._http_clients["healthy"] = mock_client(calculator_handler([]))
+
+        # Act
+        tools = asyncio.run(service.fetch_tool_definitions())
+
+        # Assert
+        assert [tool.service for tool in tools] == ["healthy"]
+
+
+class TestToolResultCache:
+    def test_lru_eviction_and_counters(self):
+        """Test that the cache evicts least recently used entries and counts hits."""
+        # Arrange
+        cache = ToolResultCache(ttl=60, max_entries=2)
+        key_a = cache.make_key("tool", {"b": 1, "a": 2})
+        key_b = cache.make_key("tool", {"x": 1})
+        key_c = cache.make_key("tool", {"y": 1})
+
+        # Act
+        cache.set(key_a, "a")
+        cache.set(key_b, "b")
+        cache.get(cache.make_key("tool", {"a": 2, "b": 1}))
+        cache.set(key_c, "c")
+
+        # Assert
+        assert cache.get(key_a) == "a"
+        assert cache.get(key_b) is None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 1
+
+    def test_expired_entries_are_misses(self, monkeypatch):
+        """Test that entries past their TTL are dropped."""
+        # Arrange
+        cache = ToolResultCache(ttl=10)
+        key = cache.make_key("tool", {})
+        cache.set(key, "value")
+
+        # Act
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+
+        # Assert
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_invalidate_one_tool_or_everything(self):
+        """Test that invalidate drops one tool's results, or all without a name."""
+        # Arrange
+        cache = ToolResultCache()
+        cache.set(cache.make_key("add", {"a": 1}), 1)
+        cache.set(cache.make_key("add", {"a": 2}), 2)
+        cache.set(cache.make_key("echo", {}), "hi")
+
+        # Act
+        cache.invalidate("add")
+        after_one = len(cache)
+        cache.invalidate()
+
+        # Assert
+        assert after_one == 1
+        assert len(cache) == 0
+        assert cache.stats()["bytes"] == 0
+
+    def test_values_are_not_sized_without_byte_budget(self, monkeypatch):
+        """Test that set() skips serializing values when max_bytes is unset."""
+        # Arrange
+        cache = ToolResultCache(max_bytes=None)
+        key = cache.make_key("tool", {})
+
+        def sizeof(value):
+            raise AssertionError("value was sized")
+
+        monkeypatch.setattr(cache, "_sizeof", sizeof)
+
+        # Act
+        cache.set(key, {"large": "x" * 1024})
+
+        # Assert
+        assert cache.get(key) == {"large": "x" * 1024}
+
+    def test_cacheable_tool_skips_backend(self, make_service):
+        """Test that repeated calls to a cache_enabled tool hit the backend once."""
+        # Arrange
+        service = make_service(settings={"cache": {"enabled": True, "ttl": 60}})
+        calls = []
+        service._http_clients["primary"] = mock_client(calculator_handler(calls))
+        asyncio.run(service.load_tools())
+        tool = service.get_tool("calculator")
+
+        # Act
+        results = [
+            tool.invoke({"first_number": 1, "second_number": 2}) for _ in range(3)
+        ]
+
+        # Assert
+        assert results == [{"result": 3}] * 3
+        assert len([c for c in calls if c.method == "POST"]) == 1
+        assert service.cache_stats()["hits"] == 2
+
+    def test_empty_cache_still_reports_counters(self, make_service):
+        """Test that an enabled cache reports stats before anything is cached."""
+        # Arrange
+        service = make_service(settings={"cache": {"enabled": True, "ttl": 60}})
+
+        # Act
+        stats = service.cache_stats()
+
+        # Assert
+        assert stats["hits"] == 0
+        assert stats["misses"] == 0
+
+    def test_changed_definition_invalidates_cached_results(self, make_service):
+        """Test that a refresh changing a cached tool stops serving its old results."""
+        # Arrange
+        service = make_service(settings={"cache": {"enabled": True, "ttl": 60}})
+        version = [1]
+
+        def handler(request):
+            if request.url.path == "/tools":
+                tool = {**TOOLS_PAYLOAD["tools"][0], "description": f"v{version[0]}"}
+                return httpx.Response(200, json={"tools": [tool]})
+            return httpx.Response(200, json={"version": version[0]})
+
+        service._http_clients["primary"] = mock_client(handler)
+        asyncio.run(service.load_tools())
+        arguments = {"first_number": 1, "second_number": 2}
+        before = service.get_tool("calculator").invoke(arguments)
+
+        # Act
+        version[0] = 2
+        asyncio.run(service.refresh_tools())
+        after = service.get_tool("calculator").invoke(arguments)
+
+        # Assert
+        assert before == {"version": 1}
+        assert after == {"version": 2}
+        assert service.get_tool("calculator").description.endswith("v2")
+
+
+class TestSingleFlight:
+    def test_identical_concurrent_calls_share_one_request(self, make_service):
+        """Test that concurrent duplicate calls fan in to one backend request."""
+        # Arrange
+        service = make_service()
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"ok": True})
+
+        service._http_clients["primary"] = mock_client(handler)
+        tool_def = ToolDefinition(
+            name="expensive",
+            description="Expensive",
+            endpoint="/expensive",
+            service="primary",
+            coalesce=True,
+        )
+
+        async def run():
+            return await asyncio.gather(
+                *(service._execute_tool(tool_def, {"q": "same"}) for _ in range(5)),
+                service._execute_tool(tool_def, {"q": "other"}),
+            )
+
+        # Act
+        results = asyncio.run(run())
+
+        # Assert
+        assert results == [{"ok": True}] * 6
+        assert len(calls) == 2
+        assert service._inflight == {}
+
+
+class TestIncrementalRefresh:
+    def test_unchanged_tools_are_not_rebuilt(self, make_service):
+        """Test that refresh sends If-None-Match and keeps unchanged tools."""
+        # Arrange
+        service = make_service()
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, json=TOOLS_PAYLOAD, headers={"ETag": '"v1"'})
+
+        service._http_clients["primary"] = mock_client(handler)
+        asyncio.run(service.load_tools())
+        first = service.get_tool("calculator")
+
+        # Act
+        asyncio.run(service.refresh_tools())
+
+        # Assert
+        assert calls[-1].headers["if-none-match"] == '"v1"'
+        assert service.get_tool("calculator") is first
+
+    def test_identical_parameter_sets_share_model(self, make_service):
+        """Test that tools with the same parameters reuse one compiled model."""
+        # Arrange
+        service = make_service()
+        params = TOOLS_PAYLOAD["tools"][0]["parameters"]
+        payload = {
+            "tools": [
+                {
+                    "name": name,
+                    "description": name,
+                    "endpoint": f"/{name}",
+                    "parameters": params,
+                }
+                for name in ("add", "multiply")
+            ]
+        }
+        service._http_clients["primary"] = mock_client(
+            lambda request: httpx.Response(200, json=payload)
+        )
+
+        # Act
+        asyncio.run(service.load_tools())
+
+        # Assert
+        assert (
+            service.get_tool("add").args_schema
+            is service.get_tool("multiply").args_schema
+        )
+        assert len(service._param_models) == 1
+
+    def test_tools_dropped_upstream_are_removed(self, make_service):
+        """Test that a tool missing from a fresh listing leaves the registry."""
+        # Arrange
+        service = make_service(settings={"cache": {"enabled": True, "ttl": 60}})
+        names = ["a", "b"]
+
+        def handler(request):
+            if request.url.path == "/tools":
+                tools = [
+                    {
+                        "name": name,
+                        "description": name,
+                        "endpoint": f"/{name}",
+                        "cache_enabled": True,
+                    }
+                    for name in names
+                ]
+                return httpx.Response(200, json={"tools": tools})
+            return httpx.Response(200, json={"ok": True})
+
+        service._http_clients["primary"] = mock_client(handler)
+        asyncio.run(service.load_tools())
+        service.get_tool("b").invoke({})
+        assert len(service.cache) == 1
+
+        # Act
+        names.remove("b")
+        asyncio.run(service.refresh_tools())
+
+        # Assert
+        assert service.list_tools() == ["a"]
+        assert "b" not in service._definition_hashes
+        assert len(service.cache) == 0
+
+    def test_failed_service_keeps_its_tools(self, make_service):
+        """Test that a service failing a refresh keeps its last known tools."""
+        # Arrange
+        service = make_service()
+        healthy = [True]
+
+        def handler(request):
+            if healthy[0]:
+                return httpx.Response(200, json=TOOLS_PAYLOAD)
+            return httpx.Response(503)
+
+        service._http_clients["primary"] = mock_client(handler)
+        asyncio.run(service.load_tools())
+        version = service.version
+
+        # Act
+        healthy[0] = False
+        asyncio.run(service.refresh_tools())
+
+        # Assert
+        assert service.list_tools() == ["calculator"]
+        assert service.version == version
+
+
+class TestBackgroundRefresh:
+    def test_refresh_loop_picks_up_new_tools(self, make_service):
+        """Test that the background loop loads and refreshes the registry."""
+        # Arrange
+        service = make_service(settings={"refresh": {"interval": 0.05}})
+        payload = {"tools": list(TOOLS_PAYLOAD["tools"])}
+        service._http_clients["primary"] = mock_client(
+            lambda request: httpx.Response(200, json=payload)
+        )
+
+        # Act
+        service.start()
+        try:
+            loaded = service.list_tools()
+            payload["tools"].append(
+                {"name": "echo", "description": "Echo", "endpoint": "/echo"}
+            )
+            deadline = time.monotonic() + 2
+            while "echo" not in service.list_tools() and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            service.stop()
+
+        # Assert
+        assert loaded == ["calculator"]
+        assert "echo" in service.list_tools()
+
+    def test_shared_service_is_reused(self, make_service, monkeypatch):
+        """Test that crews share one started tool service."""
+        # Arrange
+        monkeypatch.setattr(ToolService, "_shared", None)
+        monkeypatch.setattr(ToolService, "start", lambda self: None)
+        make_service()
+
+        # Act
+        first = ToolService.shared()
+        second = ToolService.shared()
+
+        # Assert
+        assert first is second
+
+
+class TestEventLoopBridge:
+    def test_sync_calls_reuse_one_loop(self, make_service):
+        """Test that sync tool calls from many threads share the service loop."""
+        # Arrange
+        service = make_service()
+        loops = set()
+
+        async def handler(request):
+            loops.add(asyncio.get_running_loop())
+            return httpx.Response(200, json={"ok": True})
+
+        service._http_clients["primary"] = mock_client(handler)
+        tool_def = ToolDefinition(
+            name="echo", description="Echo", endpoint="/echo", service="primary"
+        )
+        execute = service._create_tool_executor(tool_def)
+
+        # Act
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda i: execute(i=i), range(8)))
+
+        # Assert
+        assert results == [{"ok": True}] * 8
+        assert loops == {service._loop}
+
+    def test_run_sync_rejects_loop_thread(self, make_service):
+        """Test that run_sync refuses to block its own loop."""
+        # Arrange
+        service = make_service()
+
+        async def nested():
+            return service.run_sync(asyncio.sleep(0))
+
+        # Act & Assert
+        with pytest.raises(RuntimeError):
+            service.run_sync(nested())
+
+    def test_restart_creates_fresh_clients(self, make_service):
+        """Test that clients closed by stop are not reused after a restart."""
+        # Arrange
+        service = make_service()
+        service.run_sync(service._init_clients())
+        closed = service._http_clients["primary"]
+
+        # Act
+        service.stop()
+        service.run_sync(service._init_clients())
+
+        # Assert
+        assert closed.is_closed
+        assert service._http_clients["primary"] is not closed
+        assert not service._http_clients["primary"].is_closed
+
+
+class TestToolRegistry:
+    def test_refresh_swaps_snapshot(self, make_service):
+        """Test that refresh publishes a new version without mutating old snapshots."""
+        # Arrange
+        service = make_service()
+        payload = {"tools": list(TOOLS_PAYLOAD["tools"])}
+        service._http_clients["primary"] = mock_client(
+            lambda request: httpx.Response(200, json=payload)
+        )
+        asyncio.run(service.load_tools())
+        before = service.snapshot()
+
+        # Act
+        payload["tools"].append(
+            {"name": "echo", "description": "Echo", "endpoint": "/echo"}
+        )
+        asyncio.run(service.refresh_tools())
+
+        # Assert
+        assert before.names() == ["calculator"]
+        assert service.list_tools() == ["calculator", "echo"]
+        assert service.version == before.version + 1
+        with pytest.raises(TypeError):
+            service.tools["other"] = None
+
+    def test_unchanged_refresh_keeps_version(self, make_service):
+        """Test that a refresh with no changes keeps the current snapshot."""
+        # Arrange
+        service = make_service()
+        service._http_clients["primary"] = mock_client(calculator_handler([]))
+        asyncio.run(service.load_tools())
+        before = service.snapshot()
+
+        # Act
+        asyncio.run(service.refresh_tools())
+
+        # Assert
+        assert service.snapshot() is before
+
+
+class TestWarmStart:
+    def test_start_serves_snapshot_before_discovery(self, make_service):
+        """Test that a new service starts from the snapshot of a previous one."""
+        # Arrange
+        previous = make_service()
+        previous._http_clients["primary"] = mock_client(calculator_handler([]))
+        asyncio.run(previous.load_tools())
+
+        service = make_service(settings={"refresh": {"interval": 0}})
+        release = threading.Event()
+
+        def blocked_handler(request):
+            release.wait(2)
+            return calculator_handler([])(request)
+
+        service._http_clients["primary"] = mock_client(blocked_handler)
+
+        # Act
+        service.start()
+        warm_tools = service.list_tools()
+        release.set()
+
+        # Assert
+        assert warm_tools == ["calculator"]
+
+
+class TestBatchExecution:
+    def test_batch_endpoint_receives_one_request(self, make_service):
+        """Test that calls to a batch-capable service are sent in one request."""
+        # Arrange
+        services = [
+            {
+                "name": "primary",
+                "enabled": True,
+                "base_url": "http://tools.local",
+                "endpoints": [
+                    {"path": "/tools", "method": "GET"},
+                    {"path": "/tools/batch", "method": "POST"},
+                ],
+            }
+        ]
+        service = make_service(services=services)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if request.url.path == "/tools":
+                return httpx.Response(200, json=TOOLS_PAYLOAD)
+            body = json.loads(request.content)
+            return httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {"result": c["arguments"]["first_number"]}
+                        for c in body["calls"]
+                    ]
+                },
+            )
+
+        service._http_clients["primary"] = mock_client(handler)
+        asyncio.run(service.load_tools())
+
+        # Act
+        results = service.execute_batch(
+            [
+                ("calculator", {"first_number": 1, "second_number": 0}),
+                ("missing", {}),
+                ("calculator", {"first_number": "x", "second_number": 0}),
+                ("calculator", {"first_number": 2, "second_number": 0}),
+            ]
+        )
+
+        # Assert
+        assert [r.result for r in results] == [1, None, None, 2]
+        assert results[1].error == "Unknown tool 'missing'"
+        assert results[2].error is not None
+        assert [c.url.path for c in calls].count("/tools/batch") == 1
+
+    def test_calls_without_batch_endpoint_run_concurrently(self, make_service):
+        """Test that per-item failures do not fail the rest of the batch."""
+        # Arrange
+        service = make_service()
+
+        def handler(request):
+            if request.url.path == "/tools":
+                return httpx.Response(200, json=TOOLS_PAYLOAD)
+            body = json.loads(request.content)
+            if body["second_number"] == 0:
+                return httpx.Response(400)
+            return httpx.Response(
+                200, json=body["first_number"] / body["second_number"]
+            )
+
+        service._http_clients["primary"] = mock_client(handler)
+        asyncio.run(service.load_tools())
+
+        # Act
+        results = service.execute_batch(
+            [
+                ("calculator", {"first_number": 4, "second_number": 2}),
+                ("calculator", {"first_number": 4, "second_number": 0}),
+            ]
+        )
+
+        # Assert
+        assert results[0].result == 2
+        assert results[1].error is not None
+
+
+class TestResilience:
+    def test_breaker_opens_and_recovers(self, monkeypatch):
+        """Test closed -> open -> half-open -> closed transitions."""
+        # Arrange
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+        now = time.monotonic()
+
+        # Act
+        breaker.record_failure()
+        breaker.record_failure()
+        rejected = not breaker.allow()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+        probe_allowed = breaker.allow()
+        second_probe_allowed = breaker.allow()
+        breaker.record_success()
+
+        # Assert
+        assert rejected
+        assert probe_allowed and not second_probe_allowed
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_limiter_backs_off_and_ramps_up(self):
+        """Test multiplicative decrease on failure and additive increase on success."""
+        # Arrange
+        limiter = AdaptiveLimiter(initial_limit=8, max_limit=10)
+
+        # Act
+        limiter.record(0.1, failed=True)
+        after_failure = limiter.limit
+        for _ in range(20):
+            limiter.record(0.1)
+
+        # Assert
+        assert after_failure == 4
+        assert 4 < limiter.limit <= 10
+
+    def test_limiter_bounds_inflight_calls(self):
+        """Test that no more than the limit of calls run at once."""
+        # Arrange
+        limiter = AdaptiveLimiter(initial_limit=2)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with limiter:
+                peak = max(peak, limiter.inflight)
+                await asyncio.sleep(0.01)
+
+        async def run():
+            await asyncio.gather(*(call() for _ in range(6)))
+
+        # Act
+        asyncio.run(run())
+
+        # Assert
+        assert peak == 2
+        assert limiter.inflight == 0
+
+    def test_open_circuit_fails_fast(self, make_service):
+        """Test that calls to an unhealthy service stop reaching the backend."""
+        # Arrange
+        service = make_service(settings={"circuit_breaker": {"failure_threshold": 2}})
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        service._http_clients["primary"] = mock_client(handler)
+        tool_def = ToolDefinition(
+            name="flaky", description="Flaky", endpoint="/flaky", service="primary"
+        )
+
+        # Act
+        for _ in range(2):
+            with pytest.raises(ToolExecutionError):
+                service.run_sync(service._execute_tool(tool_def, {}))
+
+        # Assert
+        with pytest.raises(ToolServiceUnavailableError):
+            service.run_sync(service._execute_tool(tool_def, {}))
+        assert len(calls) == 2
+        assert service.service_health()["primary"]["state"] == "open"
+
+    def test_unexpected_error_returns_half_open_slot(self, make_service, monkeypatch):
+        """Test that a probe failing outside HTTP does not wedge the circuit."""
+        # Arrange
+        service = make_service(settings={"circuit_breaker": {"failure_threshold": 1}})
+        breaker = service._breakers["primary"]
+        breaker.record_failure()
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + breaker.reset_timeout + 1)
+
+        async def broken():
+            raise RuntimeError("client closed")
+
+        # Act
+        with pytest.raises(RuntimeError):
+            service.run_sync(service._send("primary", broken))
+
+        # Assert
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow()
+
+
+class TestStreamingResults:
+    def make_streaming_service(self, make_service, streaming, body, content_type):
+        service = make_service(settings={"streaming": streaming})
+
+        def handler(request):
+            if request.url.path == "/tools":
+                return httpx.Response(200, json=TOOLS_PAYLOAD)
+            return httpx.Response(
+                200, content=body, headers={"content-type": content_type}
+            )
+
+        service._http_clients["primary"] = mock_client(handler)
+        asyncio.run(service.load_tools())
+        return service
+
+    def test_oversized_result_is_truncated(self, make_service):
+        """Test that results beyond max_result_bytes are truncated."""
+        # Arrange
+        service = self.make_streaming_service(
+            make_service, {"max_result_bytes": 10}, b"x" * 100, "text/plain"
+        )
+
+        # Act
+        result = service.get_tool("calculator").invoke(
+            {"first_number": 1, "second_number": 2}
+        )
+
+        # Assert
+        assert result.startswith("x" * 10 + "\n...[truncated")
+
+    def test_oversized_result_spills_to_disk(self, make_service, tmp_path):
+        """Test that the spill policy writes the full body to disk."""
+        # Arrange
+        service = self.make_streaming_service(
+            make_service,
+            {"max_result_bytes": 10, "overflow": "spill", "spill_dir": str(tmp_path)},
+            b"y" * 100,
+            "text/plain",
+        )
+
+        # Act
+        result = service.get_tool("calculator").invoke(
+            {"first_number": 1, "second_number": 2}
+        )
+
+        # Assert
+        assert result["bytes"] == 100
+        assert open(result["spilled_to"], "rb").read() == b"y" * 100
+
+    def test_old_spills_are_pruned(self, make_service, tmp_path):
+        """Test that only the newest max_spill_files spills are kept."""
+        # Arrange
+        service = self.make_streaming_service(
+            make_service,
+            {
+                "max_result_bytes": 10,
+                "overflow": "spill",
+                "spill_dir": str(tmp_path),
+                "max_spill_files": 2,
+            },
+            b"y" * 100,
+            "text/plain",
+        )
+        tool = service.get_tool("calculator")
+
+        # Act
+        results = [
+            tool.invoke({"first_number": 1, "second_number": 2}) for _ in range(4)
+        ]
+
+        # Assert
+        assert len(list(tmp_path.glob("*.out"))) == 2
+        assert os.path.exists(results[-1]["spilled_to"])
+
+    def test_stalled_body_counts_against_service(self, make_service):
+        """Test that the limiter slot is held and failures recorded while reading."""
+        # Arrange
+        service = make_service(settings={"circuit_breaker": {"failure_threshold": 1}})
+        limiter = service._limiters["primary"]
+        inflight_while_reading = []
+
+        class StalledStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                inflight_while_reading.append(limiter.inflight)
+                yield b"partial"
+                raise httpx.ReadTimeout("body stalled")
+
+        service._http_clients["primary"] = mock_client(
+            lambda request: httpx.Response(200, stream=StalledStream())
+        )
+        tool_def = ToolDefinition(
+            name="stalled",
+            description="Stalled",
+            endpoint="/stalled",
+            service="primary",
+        )
+
+        # Act
+        with pytest.raises(ToolExecutionError):
+            service.run_sync(service._execute_tool(tool_def, {}))
+
+        # Assert
+        assert inflight_while_reading == [1]
+        assert limiter.inflight == 0
+        assert service.service_health()["primary"]["state"] == "open"
+
+    def test_error_policy_raises(self, make_service):
+        """Test that the error policy rejects oversized results."""
+        # Arrange
+        service = self.make_streaming_service(
+            make_service,
+            {"max_result_bytes": 10, "overflow": "error"},
+            b"z" * 100,
+            "text/plain",
+        )
+
+        # Act & Assert
+        with pytest.raises(ToolExecutionError):
+            service.get_tool("calculator").invoke(
+                {"first_number": 1, "second_number": 2}
+            )
+
+    def test_ndjson_records_are_streamed(self, make_service):
+        """Test that NDJSON responses are consumed record by record."""
+        # Arrange
+        body = b'{"row": 1}\n{"row": 2}\n\n{"row": 3}\n'
+        service = self.make_streaming_service(
+            make_service, {}, body, "application/x-ndjson"
+        )
+
+        # Act
+        records = list(
+            service.iter_tool("calculator", {"first_number": 1, "second_number": 2})
+        )
+        buffered = service.get_tool("calculator").invoke(
+            {"first_number": 1, "second_number": 2}
+        )
+
+        # Assert
+        assert records == [{"row": 1}, {"row": 2}, {"row": 3}]
+        assert buffered == records
+
+
+class TestConfigReload:
+    def test_removed_service_is_reconciled(self, make_service):
+        """Test that removing a service from tools.yaml drops its client and tools."""
+        # Arrange
+        services = [
+            {
+                "name": name,
+                "enabled": True,
+                "base_url": "http://tools.local",
+                "endpoints": [{"path": "/tools", "method": "GET"}],
+            }
+            for name in ("primary", "secondary")
+        ]
+        service = make_service(services=services)
+        secondary_payload = {
+            "tools": [{"name": "echo", "description": "Echo", "endpoint": "/echo"}]
+        }
+        service._http_clients["primary"] = mock_client(calculator_handler([]))
+        service._http_clients["secondary"] = mock_client(
+            lambda request: httpx.Response(200, json=secondary_payload)
+        )
+        service.run_sync(service.initialize())
+
+        # Act
+        change = ConfigChange(
+            "tools",
+            make_tools_config(services=services),
+            make_tools_config(services=services[:1]),
+            version=2,
+        )
+        service._on_config_change(change)
+        service.run_sync(asyncio.sleep(0.05))
+
+        # Assert
+        assert service.list_tools() == ["calculator"]
+        assert set(service._http_clients) == {"primary"}
+        assert set(service.service_health()) == {"primary"}
+        assert set(service._definition_hashes) == {"calculator"}